@@ -127,3 +127,5 @@ if env.bool('USE_HTTPS', default=False):
 CONFLUENCE_EMAIL = env('CONFLUENCE_EMAIL', default=None)
 CONFLUENCE_API_TOKEN = env('CONFLUENCE_API_TOKEN', default=None)
 CONFLUENCE_SITE_URL = env('CONFLUENCE_SITE_URL', default='https://gavinlu.atlassian.net')
+# Optional directory for caching fetched page content between imports (keyed by page version)
+CONFLUENCE_PAGE_CACHE_DIR = env('CONFLUENCE_PAGE_CACHE_DIR', default=None)
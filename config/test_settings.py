@@ -0,0 +1,20 @@
+"""
+Settings for running the test suite.
+
+Tests still need PostgreSQL (full-text search, trigram and GIN index
+migrations), so only the pieces that cost time without exercising app
+behaviour are swapped out here.
+
+    DJANGO_SETTINGS_MODULE=config.test_settings python manage.py test --parallel auto --keepdb
+"""
+from .settings import *  # noqa: F401,F403
+
+# PBKDF2 with hundreds of thousands of iterations dominates setUp time
+# for tests that create users; MD5 is fine for throwaway test accounts.
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# Keep uploaded test images off disk and away from R2.
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.InMemoryStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.db import models
+from django.utils import timezone
 from django.utils.html import format_html
 from django.contrib import messages
 from content.models import Encyclopedia
@@ -63,14 +64,16 @@ class EncyclopediaAdmin(admin.ModelAdmin):
 
     def mark_as_placeholder(self, request, queryset):
         """Admin action to mark selected entries as placeholders"""
-        updated = queryset.update(is_placeholder=True)
+        # update() skips auto_now; bumping updated_at keeps the tree page's ETag in step
+        updated = queryset.update(is_placeholder=True, updated_at=timezone.now())
         self.message_user(request, f'{updated} entry(ies) marked as placeholder.')
 
     mark_as_placeholder.short_description = 'Mark selected entries as placeholder'
 
     def mark_as_complete(self, request, queryset):
         """Admin action to mark selected entries as complete"""
-        updated = queryset.update(is_placeholder=False)
+        # update() skips auto_now; bumping updated_at keeps the tree page's ETag in step
+        updated = queryset.update(is_placeholder=False, updated_at=timezone.now())
         self.message_user(request, f'{updated} entry(ies) marked as complete.')
 
     mark_as_complete.short_description = 'Mark selected entries as complete'
@@ -0,0 +1,39 @@
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def populate_rating_totals(apps, schema_editor):
+    Review = apps.get_model('content', 'Review')
+    ReviewDish = apps.get_model('content', 'ReviewDish')
+
+    totals = (
+        ReviewDish.objects.filter(dish_rating__isnull=False)
+        .values('review_id')
+        .annotate(rating_sum=Sum('dish_rating'), rating_count=Count('id'))
+    )
+    for row in totals:
+        Review.objects.filter(pk=row['review_id']).update(
+            rating_sum=row['rating_sum'],
+            rating_count=row['rating_count'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0028_restaurant_pop_up_website'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_rating_totals, migrations.RunPython.noop),
+    ]
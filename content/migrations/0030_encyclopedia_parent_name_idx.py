@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0029_review_rating_sum_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='encyclopedia',
+            index=models.Index(fields=['parent', 'name'], name='content_enc_parent__da11cb_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-16 11:40
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0030_encyclopedia_parent_name_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='encyclopedia',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='content_enc_name_upper_idx'),
+        ),
+    ]
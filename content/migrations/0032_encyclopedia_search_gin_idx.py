@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-16 12:25
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0031_encyclopedia_name_upper_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='encyclopedia',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='content_enc_search_gin_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-16 13:05
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0032_encyclopedia_search_gin_idx'),
+    ]
+
+    operations = [
+        # Already relied on by TrigramSimilarity in the suggest API; no-op if installed
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='encyclopedia',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='content_enc_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='encyclopedia',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='content_enc_name_up_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='encyclopedia',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('description'), name='gin_trgm_ops'), name='content_enc_desc_trgm_idx'),
+        ),
+    ]
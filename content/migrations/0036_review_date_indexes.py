@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-16 14:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0035_restaurant_name_trgm_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['restaurant', '-visit_date', '-entry_time'], name='content_rev_rest_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('is_private', False)), fields=['-visit_date', '-entry_time'], name='content_rev_public_date_idx'),
+        ),
+    ]
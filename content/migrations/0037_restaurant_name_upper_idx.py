@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-16 15:05
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0036_review_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='restaurant',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='content_rest_name_upper_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-16 15:40
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0037_restaurant_name_upper_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reviewdish',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('dish_name'), name='gin_trgm_ops'), name='content_rd_name_trgm_idx'),
+        ),
+    ]
@@ -1,6 +1,10 @@
-from django.db import models
+from collections import defaultdict
+
+from django.db import connection, models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import User
 from django.contrib.postgres.fields import JSONField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.contrib.postgres.search import SearchVectorField, SearchVector
 from django.contrib.contenttypes.fields import GenericRelation
 from django.core.exceptions import ValidationError
@@ -60,6 +64,15 @@ class Encyclopedia(models.Model):
         indexes = [
             models.Index(fields=['slug']),
             models.Index(fields=['parent']),
+            models.Index(fields=['parent', 'name']),
+            # Serves case-insensitive name lookups (name__iexact compares UPPER(name))
+            models.Index(Upper('name'), name='content_enc_name_upper_idx'),
+            GinIndex(fields=['search_vector'], name='content_enc_search_gin_idx'),
+            # Serves the suggest API's trigram % operator (name__trigram_similar), which compares the raw column
+            GinIndex(fields=['name'], name='content_enc_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            # Serve the search API's icontains matches, which compare UPPER(column) LIKE UPPER('%...%')
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='content_enc_name_up_trgm_idx'),
+            GinIndex(OpClass(Upper('description'), name='gin_trgm_ops'), name='content_enc_desc_trgm_idx'),
             models.Index(fields=['cuisine_type']),
             models.Index(fields=['dish_category']),
         ]
@@ -76,32 +89,72 @@ class Encyclopedia(models.Model):
         """
         return not self.is_placeholder or bool(self.description)
 
+    def _ancestors_cte(self):
+        """
+        Return the WITH RECURSIVE clause walking up from self.parent_id.
+
+        The "ancestors" rows carry id and level (1 for the immediate parent).
+        Each row records the ids already visited, so a cycle stops the walk
+        instead of looping forever.
+        """
+        table = self._meta.db_table
+        return f"""
+            WITH RECURSIVE ancestors AS (
+                SELECT id, parent_id, 1 AS level, ARRAY[id] AS path
+                FROM {table}
+                WHERE id = %s
+                UNION ALL
+                SELECT e.id, e.parent_id, a.level + 1, a.path || e.id
+                FROM {table} e
+                JOIN ancestors a ON e.id = a.parent_id
+                WHERE e.id <> ALL(a.path)
+            )
+        """
+
     def get_ancestors(self):
         """
         Get all ancestors of this entry, starting from the immediate parent
         and going up to the root.
+
+        The whole parent chain is fetched with one recursive query instead of
+        one query per level.
         """
-        ancestors = []
-        current = self.parent
-        visited = set()  # Prevent infinite loops
+        if self.parent_id is None:
+            return []
 
-        while current is not None:
-            if current.id in visited:
-                break
-            visited.add(current.id)
-            ancestors.append(current)
-            current = current.parent
+        table = self._meta.db_table
+        return list(Encyclopedia.objects.raw(
+            self._ancestors_cte() + f"""
+            SELECT e.*
+            FROM {table} e
+            JOIN ancestors a ON e.id = a.id
+            ORDER BY a.level
+            """,
+            [self.parent_id],
+        ))
 
-        return ancestors
+    def get_ancestor_ids(self):
+        """
+        Get the ids of get_ancestors(), in the same order, without loading the rows.
+        """
+        if self.parent_id is None:
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                self._ancestors_cte() + "SELECT id FROM ancestors ORDER BY level",
+                [self.parent_id],
+            )
+            return [row[0] for row in cursor.fetchall()]
 
     def get_depth(self):
         """
         Calculate depth level in hierarchy (0 for root entries).
-        Uses get_ancestors() which includes cycle detection.
+        Counts get_ancestor_ids(), which includes cycle detection.
         """
-        if not self.parent:
+        if not self.parent_id:
             return 0
-        return len(self.get_ancestors())
+        return len(self.get_ancestor_ids())
 
     def get_hierarchy_breadcrumb(self, separator=' > '):
         """
@@ -121,21 +174,42 @@ class Encyclopedia(models.Model):
 
     def get_descendants(self):
         """
-        Get all descendants of this entry recursively.
-        """
-        descendants = []
-        visited = set()  # Prevent infinite loops
+        Get all descendants of this entry, depth-first with siblings ordered by name.
 
-        def collect_children(entry):
-            if entry.id in visited:
-                return
-            visited.add(entry.id)
+        The subtree is fetched with one recursive query and ordered in memory,
+        instead of querying each node's children in turn.
+        """
+        table = self._meta.db_table
+        entries = Encyclopedia.objects.raw(
+            f"""
+            WITH RECURSIVE descendants AS (
+                SELECT id, ARRAY[parent_id, id] AS path
+                FROM {table}
+                WHERE parent_id = %s
+                UNION ALL
+                SELECT e.id, d.path || e.id
+                FROM {table} e
+                JOIN descendants d ON e.parent_id = d.id
+                WHERE e.id <> ALL(d.path)
+            )
+            SELECT e.*
+            FROM {table} e
+            WHERE e.id IN (SELECT id FROM descendants)
+            ORDER BY e.name
+            """,
+            [self.pk],
+        )
 
-            for child in entry.children.all():
-                descendants.append(child)
-                collect_children(child)
+        children_by_parent = defaultdict(list)
+        for entry in entries:
+            children_by_parent[entry.parent_id].append(entry)
 
-        collect_children(self)
+        descendants = []
+        stack = list(reversed(children_by_parent[self.pk]))
+        while stack:
+            entry = stack.pop()
+            descendants.append(entry)
+            stack.extend(reversed(children_by_parent[entry.id]))
         return descendants
 
     def _check_cycle(self):
@@ -149,20 +223,14 @@ class Encyclopedia(models.Model):
         if self.parent.id == self.id:
             raise ValidationError("An entry cannot be its own parent.")
 
-        # Check if parent is in descendants
-        current = self.parent
-        visited = set()
-
-        while current is not None:
-            if current.id == self.id:
-                raise ValidationError(
-                    f"Setting '{self.parent.name}' as parent would create a cycle. "
-                    f"'{self.name}' is an ancestor of '{self.parent.name}'."
-                )
-            if current.id in visited:
-                break
-            visited.add(current.id)
-            current = current.parent
+        # Check if this entry is among the new parent's ancestors, i.e. the
+        # parent is one of its descendants. The chain comes from one recursive
+        # query rather than a query per level.
+        if self.id is not None and self.id in self.parent.get_ancestor_ids():
+            raise ValidationError(
+                f"Setting '{self.parent.name}' as parent would create a cycle. "
+                f"'{self.name}' is an ancestor of '{self.parent.name}'."
+            )
 
     def save(self, *args, **kwargs):
         """
@@ -188,8 +256,10 @@ def update_search_vector(sender, instance, **kwargs):
     Signal handler to automatically update search_vector field when Encyclopedia is saved.
     Updates the search vector with combined name and description content.
     """
-    # Avoid infinite recursion by checking if we're already updating
-    if kwargs.get('update_fields') and 'search_vector' in kwargs['update_fields']:
+    # Avoid infinite recursion by checking if we're already updating, and skip
+    # partial saves that leave the indexed text unchanged
+    update_fields = kwargs.get('update_fields')
+    if update_fields and ('search_vector' in update_fields or not {'name', 'description'} & update_fields):
         return
 
     # Update search_vector with name and description
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import SearchVectorField, SearchVector
 from django.contrib.contenttypes.fields import GenericRelation
 from django.db.models.signals import post_save
@@ -81,6 +82,7 @@ class Recipe(models.Model):
             models.Index(fields=['difficulty']),
             models.Index(fields=['encyclopedia_entry']),
             models.Index(fields=['is_private']),
+            GinIndex(fields=['search_vector'], name='content_rec_search_gin_idx'),
         ]
 
     def __str__(self):
@@ -1,6 +1,8 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import User
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.contrib.postgres.search import SearchVectorField, SearchVector
 from django.db.models.signals import post_save
 from django.dispatch import receiver
@@ -41,6 +43,10 @@ class Restaurant(models.Model):
         unique_together = [('name', 'street_address')]
         indexes = [
             models.Index(fields=['name'], name='content_restaurant_name_idx'),
+            # Serves the review list's restaurant filter (restaurant__name__iexact compares UPPER(name))
+            models.Index(Upper('name'), name='content_rest_name_upper_idx'),
+            # Serves the autocomplete's name__icontains, which compares UPPER(name) LIKE UPPER('%...%')
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='content_rest_name_trgm_idx'),
         ]
 
     def __str__(self):
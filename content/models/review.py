@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import SearchVectorField, SearchVector
 from django.contrib.contenttypes.fields import GenericRelation
 from django.db.models.signals import post_save
@@ -35,6 +36,11 @@ class Review(models.Model):
     )
     notes = models.TextField(blank=True)
 
+    # Running totals of rated dishes, maintained incrementally by ReviewDish
+    # signals so the auto-calculated rating never has to re-scan every dish.
+    rating_sum = models.PositiveIntegerField(default=0, editable=False)
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
+
     # Metadata Fields
     created_by = models.ForeignKey(
         User,
@@ -60,6 +66,15 @@ class Review(models.Model):
         indexes = [
             models.Index(fields=['-visit_date']),
             models.Index(fields=['created_by']),
+            # Related reviews on the detail page: one restaurant's reviews, newest first
+            models.Index(fields=['restaurant', '-visit_date', '-entry_time'], name='content_rev_rest_date_idx'),
+            # Recent public reviews on the home page
+            models.Index(
+                fields=['-visit_date', '-entry_time'],
+                name='content_rev_public_date_idx',
+                condition=models.Q(is_private=False),
+            ),
+            GinIndex(fields=['search_vector'], name='content_rev_search_gin_idx'),
         ]
 
     def __str__(self):
@@ -96,31 +111,48 @@ class Review(models.Model):
         """
         Calculate overall rating as the average of all dish ratings.
 
+        Uses the denormalized rating_sum/rating_count totals rather than
+        querying the review's dishes.
+
         Returns:
             int: Average rating (0-100), or 50 if no rated dishes exist
         """
-        # Get all dish ratings that are not None
-        dish_ratings = self.review_dishes.filter(
-            dish_rating__isnull=False
-        ).values_list('dish_rating', flat=True)
-
-        if dish_ratings:
+        if self.rating_count:
             # Calculate average and round to nearest integer
-            return round(sum(dish_ratings) / len(dish_ratings))
+            return round(self.rating_sum / self.rating_count)
 
         # Default to neutral rating if no rated dishes
         return 50
 
+    def apply_dish_rating_delta(self, sum_delta, count_delta):
+        """
+        Adjust the rated-dish totals by the given deltas.
+
+        Issues a single F()-expression UPDATE so concurrent dish writes
+        cannot lose each other's changes, then reloads just the two totals
+        since this instance may have been loaded before other dish writes.
+        """
+        if not sum_delta and not count_delta:
+            return
+        Review.objects.filter(pk=self.pk).update(
+            rating_sum=models.F('rating_sum') + sum_delta,
+            rating_count=models.F('rating_count') + count_delta,
+        )
+        self.refresh_from_db(fields=['rating_sum', 'rating_count'])
+
     def get_all_images_ordered(self):
         """
         Return all images for this review in display order:
         review-level images first, then each dish's images in dish id order.
         Each item is a dict with 'url' and 'caption'.
+
+        Reads prefetched 'images' and 'review_dishes__images' when the
+        review was loaded with them, so list pages don't query per card.
         """
         result = []
         for img in self.images.all():
             result.append({'url': img.image.url, 'caption': img.caption or ''})
-        for dish in self.review_dishes.prefetch_related('images').all():
+        for dish in self.review_dishes.all():
             for img in dish.images.all():
                 result.append({'url': img.image.url, 'caption': img.caption or ''})
         return result
@@ -134,22 +166,25 @@ class Review(models.Model):
         2. First image from highest-rated dish (if available)
         3. None (if no images exist anywhere)
 
+        Like get_all_images_ordered, uses prefetched images and dishes when present.
+
         Returns:
             Image instance or None
         """
         # Try review-level image first
-        review_image = self.images.first()
-        if review_image:
-            return review_image
+        review_images = self.images.all()
+        if review_images:
+            return review_images[0]
 
         # Fall back to highest-rated dish image
-        highest_rated_dish = self.review_dishes.filter(
-            dish_rating__isnull=False,
-            images__isnull=False
-        ).order_by('-dish_rating').first()
+        rated_dishes = [
+            dish for dish in self.review_dishes.all()
+            if dish.dish_rating is not None and dish.images.all()
+        ]
 
-        if highest_rated_dish:
-            return highest_rated_dish.images.first()
+        if rated_dishes:
+            highest_rated_dish = max(rated_dishes, key=lambda dish: dish.dish_rating)
+            return highest_rated_dish.images.all()[0]
 
         return None
 
@@ -1,8 +1,10 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
 from django.dispatch import receiver
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models.functions import Upper
 from .review import Review
 from .encyclopedia import Encyclopedia
 
@@ -51,10 +53,20 @@ class ReviewDish(models.Model):
     # GenericRelation for images
     images = GenericRelation('Image')
 
+    # dish_rating/review_id as last read from or written to the database,
+    # used to compute incremental deltas for the review's rating totals
+    # (DEFERRED when the row was loaded without them)
+    _loaded_dish_rating = None
+    _loaded_review_id = None
+
     class Meta:
         ordering = ['review', 'id']
         verbose_name = 'Review Dish'
         verbose_name_plural = 'Review Dishes'
+        indexes = [
+            # Serves the dish list's dish_name__icontains search, which compares UPPER(dish_name) LIKE UPPER('%...%')
+            GinIndex(OpClass(Upper('dish_name'), name='gin_trgm_ops'), name='content_rd_name_trgm_idx'),
+        ]
 
     def __str__(self):
         if self.encyclopedia_entry:
@@ -65,15 +77,27 @@ class ReviewDish(models.Model):
             dish_display = "Unlinked Dish"
         return f"{self.review} - {dish_display}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Read __dict__ so .only()/.defer() querysets don't load the fields one row at a time
+        instance._loaded_dish_rating = instance.__dict__.get('dish_rating', models.DEFERRED)
+        instance._loaded_review_id = instance.__dict__.get('review_id', models.DEFERRED)
+        return instance
 
-@receiver(post_save, sender=ReviewDish)
-def update_review_search_on_dish_save(sender, instance, **kwargs):
+
+def _rating_contribution(rating):
+    """Return the (sum, count) a single dish rating adds to its review's totals."""
+    if rating is None:
+        return 0, 0
+    return rating, 1
+
+
+def _sync_review_rating(review):
     """
-    When a ReviewDish is saved, trigger the Review's search vector update
-    and recalculate overall rating if it's set to auto-calculate.
+    Trigger the Review's search vector update and recalculate overall rating
+    if it's set to auto-calculate.
     """
-    review = instance.review
-
     # Only recalculate if the rating is set to auto-calculate
     if review.metadata.get('rating_auto_calculated', False):
         new_rating = review._calculate_rating_from_dishes()
@@ -82,33 +106,77 @@ def update_review_search_on_dish_save(sender, instance, **kwargs):
         if review.rating != new_rating:
             review.rating = new_rating
             review.save(update_fields=['rating', 'updated_at'])
-        else:
-            # Just trigger search vector update
-            review.save(update_fields=['updated_at'])
-    else:
-        # Just trigger search vector update
-        review.save(update_fields=['updated_at'])
+            return
 
+    # Just trigger search vector update
+    review.save(update_fields=['updated_at'])
 
-@receiver(post_delete, sender=ReviewDish)
-def update_review_search_on_dish_delete(sender, instance, **kwargs):
+
+@receiver(pre_save, sender=ReviewDish)
+@receiver(pre_delete, sender=ReviewDish)
+def load_deferred_dish_rating(sender, instance, **kwargs):
+    """
+    Read the stored dish_rating/review_id before saving or deleting a dish
+    that was loaded without them, so the rating delta starts from the right
+    values.
+    """
+    if instance._state.adding:
+        return
+    if instance._loaded_dish_rating is not models.DEFERRED and instance._loaded_review_id is not models.DEFERRED:
+        return
+    stored = ReviewDish.objects.filter(pk=instance.pk).values('dish_rating', 'review_id').first()
+    if stored is None:
+        return
+    if instance._loaded_dish_rating is models.DEFERRED:
+        instance._loaded_dish_rating = stored['dish_rating']
+    if instance._loaded_review_id is models.DEFERRED:
+        instance._loaded_review_id = stored['review_id']
+
+
+@receiver(post_save, sender=ReviewDish)
+def update_review_search_on_dish_save(sender, instance, created, **kwargs):
     """
-    When a ReviewDish is deleted, trigger the Review's search vector update
-    and recalculate overall rating if it's set to auto-calculate.
+    When a ReviewDish is saved, apply the change in its rating to the Review's
+    running totals and re-sync the Review.
     """
+    new_sum, new_count = _rating_contribution(instance.dish_rating)
+    old_review_id = None if created else instance._loaded_review_id
+    old_sum, old_count = (0, 0) if created else _rating_contribution(instance._loaded_dish_rating)
+
     review = instance.review
+    if old_review_id is not None and old_review_id != instance.review_id:
+        # Dish moved between reviews: take it out of the old review's totals
+        old_review = Review.objects.filter(pk=old_review_id).first()
+        if old_review is not None:
+            old_review.apply_dish_rating_delta(-old_sum, -old_count)
+            _sync_review_rating(old_review)
+        review.apply_dish_rating_delta(new_sum, new_count)
+    else:
+        review.apply_dish_rating_delta(new_sum - old_sum, new_count - old_count)
 
-    # Only recalculate if the rating is set to auto-calculate
-    if review.metadata.get('rating_auto_calculated', False):
-        new_rating = review._calculate_rating_from_dishes()
+    instance._loaded_dish_rating = instance.dish_rating
+    instance._loaded_review_id = instance.review_id
+    _sync_review_rating(review)
 
-        # Only update if rating has changed
-        if review.rating != new_rating:
-            review.rating = new_rating
-            review.save(update_fields=['rating', 'updated_at'])
-        else:
-            # Just trigger search vector update
-            review.save(update_fields=['updated_at'])
+
+@receiver(post_delete, sender=ReviewDish)
+def update_review_search_on_dish_delete(sender, instance, **kwargs):
+    """
+    When a ReviewDish is deleted, remove its rating from the Review's running
+    totals and re-sync the Review.
+    """
+    # The row that was deleted holds the last saved values, not any unsaved edit
+    if instance._loaded_review_id is None:
+        stored_rating, review = instance.dish_rating, instance.review
     else:
-        # Just trigger search vector update
-        review.save(update_fields=['updated_at'])
+        stored_rating = instance._loaded_dish_rating
+        if instance.__dict__.get('review_id') == instance._loaded_review_id:
+            review = instance.review
+        else:
+            review = Review.objects.filter(pk=instance._loaded_review_id).first()
+            if review is None:
+                return
+    old_sum, old_count = _rating_contribution(stored_rating)
+
+    review.apply_dish_rating_delta(-old_sum, -old_count)
+    _sync_review_rating(review)
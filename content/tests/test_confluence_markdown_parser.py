@@ -0,0 +1,57 @@
+from django.test import SimpleTestCase
+
+from content.utils.parsers import ConfluenceMarkdownParser
+
+
+PAGE_HEADER = (
+    '| Address | 1 A St |\n'
+    '| Date | 2024-03-04 |\n'
+    '| Time of Entry | 6:45 PM |\n'
+    '| Party | Two people |\n'
+    '| **Total** | $30 |\n'
+)
+
+
+class ConfluenceMarkdownDishHeadingTest(SimpleTestCase):
+    def setUp(self):
+        self.parser = ConfluenceMarkdownParser()
+
+    def _dishes(self, body):
+        parsed = self.parser.parse('42', PAGE_HEADER + body)
+        return [(dish.name, dish.rating) for dish in parsed.dishes]
+
+    def test_h1_dish_headings(self):
+        body = (
+            '\n# **Pho**\n**Overall Rating - 80/100**\n'
+            '\n# **Banh Mi**\n**Overall Rating - 60/100**\n'
+        )
+
+        self.assertEqual(self._dishes(body), [('Pho', 80), ('Banh Mi', 60)])
+
+    def test_h2_dish_headings(self):
+        body = (
+            '\n## **Pho**\n**Overall Rating - 80/100**\n'
+            '\n## **Banh Mi**\n**Overall Rating - 60/100**\n'
+        )
+
+        self.assertEqual(self._dishes(body), [('Pho', 80), ('Banh Mi', 60)])
+
+    def test_h2_heading_ends_visit_notes(self):
+        body = '\nThe place was lovely and we had a good time with friends.\n\n## **Pho**\n**Overall Rating - 80/100**\n'
+
+        parsed = self.parser.parse('42', PAGE_HEADER + body)
+
+        self.assertNotIn('Pho', parsed.notes)
+        self.assertEqual(parsed.rating, 80)
+
+
+class ConfluenceMarkdownPartySizeTest(SimpleTestCase):
+    def setUp(self):
+        self.parser = ConfluenceMarkdownParser()
+
+    def test_bold_party_word(self):
+        content = PAGE_HEADER.replace('| Party | Two people |', '| Party | **Two** |')
+
+        parsed = self.parser.parse('42', content + '\n# **Pho**\n**Overall Rating - 80/100**\n')
+
+        self.assertEqual(parsed.party_size, 2)
@@ -0,0 +1,55 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from content.utils.confluence_api import ConfluenceClient
+
+
+# Descendant listing entries as returned by Confluence v2: no version field
+DESCENDANTS = {
+    'results': [
+        {'id': '10', 'status': 'current', 'title': 'Chinese', 'type': 'page', 'parentId': '1', 'depth': 1},
+        {'id': '20', 'status': 'current', 'title': 'Pho Place', 'type': 'page', 'parentId': '10', 'depth': 2},
+    ],
+    '_links': {},
+}
+
+
+@override_settings(CONFLUENCE_PAGE_CACHE_DIR=None)
+class ConfluencePageCacheTest(SimpleTestCase):
+    def setUp(self):
+        self.client = ConfluenceClient(email='user@example.com', api_token='token')
+        self.version = 3
+
+    def _request(self, method, endpoint, params=None):
+        if endpoint == '/pages/1/descendants':
+            return DESCENDANTS
+        if endpoint == '/pages':
+            ids = params['id'].split(',')
+            return {'results': [{'id': page_id, 'version': {'number': self.version}} for page_id in ids], '_links': {}}
+        if endpoint == '/pages/20':
+            return {
+                'id': '20',
+                'version': {'number': self.version},
+                'body': {'storage': {'value': '<p>Great pho</p>'}},
+            }
+        raise AssertionError(f'Unexpected request: {endpoint}')
+
+    def test_unchanged_page_is_served_from_cache(self):
+        with mock.patch.object(self.client, '_request', side_effect=self._request):
+            first = self.client.get_restaurant_reviews('1')
+            with mock.patch.object(self.client, 'get_page') as get_page:
+                second = self.client.get_restaurant_reviews('1')
+
+        get_page.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertEqual(first[0]['body'], 'Great pho')
+
+    def test_new_version_is_fetched(self):
+        with mock.patch.object(self.client, '_request', side_effect=self._request):
+            self.client.get_restaurant_reviews('1')
+            self.version = 4
+            with mock.patch.object(self.client, 'get_page', wraps=self.client.get_page) as get_page:
+                self.client.get_restaurant_reviews('1')
+
+        get_page.assert_called_once_with('20')
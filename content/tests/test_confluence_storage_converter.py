@@ -0,0 +1,51 @@
+from django.test import SimpleTestCase
+
+from content.utils.confluence_api import convert_confluence_storage_to_markdown
+
+
+class ConfluenceStorageConverterTest(SimpleTestCase):
+    def test_paragraphs_and_line_breaks(self):
+        markdown = convert_confluence_storage_to_markdown('<p>a<br />b</p><p>c</p>')
+
+        self.assertEqual(markdown, 'a\nb\n\nc')
+
+    def test_partially_bold_heading(self):
+        markdown = convert_confluence_storage_to_markdown('<h1><strong>Pho</strong> (spicy)</h1>')
+
+        self.assertEqual(markdown, '# **Pho (spicy)**')
+
+    def test_heading_levels(self):
+        markdown = convert_confluence_storage_to_markdown('<h2>Pho</h2><h3><em>Banh Mi</em></h3>')
+
+        self.assertEqual(markdown, '## **Pho**\n\n### ***Banh Mi***')
+
+    def test_table_cells(self):
+        storage = (
+            '<table><tbody>'
+            '<tr><th><p><strong>Date</strong></p></th><td><p><time datetime="2024-03-04" /></p></td></tr>'
+            '<tr><td><p>Party</p></td><td><p>Two<br />people</p></td></tr>'
+            '</tbody></table>'
+        )
+
+        markdown = convert_confluence_storage_to_markdown(storage)
+
+        self.assertEqual(markdown, '| **Date** | 2024-03-04 |\n| --- | --- |\n| Party | Twopeople |')
+
+    def test_image(self):
+        storage = '<p>Before</p><ac:image ac:height="250"><ri:attachment ri:filename="pho.jpg" /></ac:image>'
+
+        markdown = convert_confluence_storage_to_markdown(storage)
+
+        self.assertEqual(markdown, 'Before\n\n![IMAGE:pho.jpg]')
+
+    def test_other_macros_keep_their_text(self):
+        storage = '<ac:structured-macro ac:name="info"><ac:rich-text-body><p>Cash only</p></ac:rich-text-body></ac:structured-macro>'
+
+        markdown = convert_confluence_storage_to_markdown(storage)
+
+        self.assertEqual(markdown, 'Cash only')
+
+    def test_entities_decoded_once(self):
+        markdown = convert_confluence_storage_to_markdown('<p>Fish &amp; chips &mdash; x &amp;lt; y</p>')
+
+        self.assertEqual(markdown, 'Fish & chips — x &lt; y')
@@ -61,3 +61,26 @@ class EncyclopediaSearchApiViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         names = [r['name'] for r in json.loads(response.content)['results']]
         self.assertIn('Pho', names)
+
+    def test_results_include_hierarchy_breadcrumb(self):
+        asian = make_entry(name='Asian', slug='asian')
+        thai = make_entry(name='Thai', slug='thai', parent=asian)
+        make_entry(name='Pad Thai', description='Stir-fried noodles', slug='pad-thai', parent=thai)
+        make_entry(name='Rice noodles', description='Flat noodles', slug='rice-noodles')
+
+        response = self.client.get(self.url, {'q': 'noodles'})
+
+        self.assertEqual(response.status_code, 200)
+        hierarchy = {r['name']: r['hierarchy'] for r in json.loads(response.content)['results']}
+        self.assertEqual(hierarchy['Pad Thai'], 'Asian > Thai')
+        self.assertEqual(hierarchy['Rice noodles'], '')
+
+    def test_fulltext_matches_rank_ahead_of_partial_matches(self):
+        make_entry(name='Saxophone', description='Not food', slug='saxophone')
+        make_entry(name='Pho', description='Vietnamese noodle soup', slug='pho')
+
+        response = self.client.get(self.url, {'q': 'pho'})
+
+        self.assertEqual(response.status_code, 200)
+        names = [r['name'] for r in json.loads(response.content)['results']]
+        self.assertEqual(names, ['Pho', 'Saxophone'])
@@ -2,7 +2,7 @@ from django.contrib.auth.models import User
 from django.test import TestCase, Client
 from django.urls import reverse
 
-from content.models import Restaurant
+from content.models import Encyclopedia, Restaurant
 
 
 class GlobalSearchRestaurantTest(TestCase):
@@ -42,3 +42,16 @@ class GlobalSearchRestaurantTest(TestCase):
 
         names = [r.name for r in response.context['results'] if r.content_type == 'restaurant']
         self.assertEqual(names, [])
+
+    def test_results_from_all_types_are_ranked_together(self):
+        Restaurant.objects.create(name='Ramen House', city='Toronto')
+        Encyclopedia.objects.create(name='Ramen', description='Ramen noodle soup', is_placeholder=False)
+
+        response = self.client.get(self.url, {'q': 'Ramen'})
+
+        results = response.context['results']
+        self.assertEqual({r.content_type for r in results}, {'encyclopedia', 'restaurant'})
+        self.assertIsInstance(results[0], Encyclopedia)
+        ranks = [r.rank for r in results]
+        self.assertEqual(ranks, sorted(ranks, reverse=True))
+        self.assertEqual(response.context['paginator'].count, 2)
@@ -12,14 +12,15 @@ class ReviewRatingCalculationTestCase(TestCase):
     Implements FT-76: Auto-calculate overall rating from dish ratings when not provided.
     """
 
-    def setUp(self):
-        """Set up test data"""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the whole class"""
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
-        self.restaurant = Restaurant.objects.create(name="Test Restaurant")
+        cls.restaurant = Restaurant.objects.create(name="Test Restaurant")
 
     def test_new_review_without_rating_defaults_to_50(self):
         """Test that a new review without rating gets default value of 50"""
@@ -285,3 +286,32 @@ class ReviewRatingCalculationTestCase(TestCase):
 
         review.refresh_from_db()
         self.assertFalse(review.metadata.get('rating_auto_calculated', False))
+
+    def test_rating_totals_track_dish_changes(self):
+        """Test that rating_sum/rating_count follow dish creates, updates and deletes"""
+        review = Review.objects.create(
+            restaurant=self.restaurant,
+            visit_date=date(2025, 10, 31),
+            entry_time=time(18, 30),
+            party_size=2,
+            rating=0,
+            created_by=self.user
+        )
+
+        dish1 = ReviewDish.objects.create(review=review, dish_name="Pasta", dish_rating=80)
+        dish2 = ReviewDish.objects.create(review=review, dish_name="Pizza", dish_rating=None)
+
+        # Rate a previously unrated dish, reloaded so the update starts from the DB state
+        dish2 = ReviewDish.objects.get(pk=dish2.pk)
+        dish2.dish_rating = 60
+        dish2.save()
+
+        review.refresh_from_db()
+        self.assertEqual((review.rating_sum, review.rating_count), (140, 2))
+        self.assertEqual(review.rating, 70)
+
+        dish1.delete()
+
+        review.refresh_from_db()
+        self.assertEqual((review.rating_sum, review.rating_count), (60, 1))
+        self.assertEqual(review.rating, 60)
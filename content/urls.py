@@ -1,47 +1,55 @@
 from django.urls import path
 from . import views
-from content.views.review_draft_api import ReviewDraftSaveApiView, ReviewDraftRetrieveApiView, ReviewDraftDeleteApiView
-from content.views.review_create_api import ReviewCreateApiView
 
 app_name = 'content'
 
+# (route, view class, name) tables; urlpatterns is built from these below.
+_ROUTES = (
+    ('', views.HomeView, 'home'),
+    ('search/', views.GlobalSearchView, 'global_search'),
+    ('encyclopedia/', views.EncyclopediaListView, 'encyclopedia_list'),
+    ('encyclopedia/search/', views.EncyclopediaSearchView, 'encyclopedia_search'),
+    ('encyclopedia/<slug:slug>/', views.EncyclopediaDetailView, 'encyclopedia_detail'),
+    ('restaurants/', views.RestaurantListView, 'restaurant_list'),
+    ('restaurants/new/', views.RestaurantCreateView, 'restaurant_create'),
+    ('restaurants/<int:pk>/', views.RestaurantDetailView, 'restaurant_detail'),
+    ('restaurants/<int:pk>/edit/', views.RestaurantUpdateView, 'restaurant_edit'),
+    ('restaurants/<int:pk>/toggle-visited/', views.RestaurantToggleVisitedView, 'restaurant_toggle_visited'),
+    ('restaurants/<int:pk>/dishes/add/', views.RestaurantDishCreateView, 'restaurant_dish_create'),
+    ('restaurants/<int:pk>/dishes/<int:dish_pk>/edit/', views.RestaurantDishUpdateView, 'restaurant_dish_update'),
+    ('restaurants/<int:pk>/dishes/<int:dish_pk>/delete/', views.RestaurantDishDeleteView, 'restaurant_dish_delete'),
+    ('restaurants/<int:pk>/dishes/<int:dish_pk>/mark-tried/', views.RestaurantDishMarkTriedView, 'restaurant_dish_mark_tried'),
+    ('reviews/', views.ReviewListView, 'review_list'),
+    ('reviews/<int:pk>/', views.ReviewDetailView, 'review_detail'),
+    ('dishes/', views.ReviewDishListView, 'review_dish_list'),
+    ('recipes/', views.RecipeListView, 'recipe_list'),
+    ('recipes/<slug:slug>/', views.RecipeDetailView, 'recipe_detail'),
+    ('wishlist/add/', views.WishlistBulkPageView, 'wishlist_bulk_add'),
+)
+
+# Mounted under 'api/'; names stay in the flat 'content' namespace.
+_API_ROUTES = (
+    ('restaurants/search/', views.RestaurantSearchApiView, 'api_restaurant_search'),
+    ('encyclopedia/search/', views.EncyclopediaSearchApiView, 'api_encyclopedia_search'),
+    ('encyclopedia/suggest/', views.EncyclopediaSuggestApiView, 'api_encyclopedia_suggest'),
+    ('encyclopedia/create/', views.EncyclopediaCreateApiView, 'api_encyclopedia_create'),
+    ('encyclopedia/create-placeholder/', views.EncyclopediaQuickCreateApiView, 'api_encyclopedia_quick_create'),
+    ('encyclopedia/<int:entry_id>/set-parent/', views.EncyclopediaParentApiView, 'api_encyclopedia_set_parent'),
+    ('dishes/<int:dish_id>/link/', views.DishLinkApiView, 'api_dish_link'),
+    ('dishes/<int:dish_id>/upload-image/', views.DishImageUploadApiView, 'api_dish_image_upload'),
+    ('reviews/create/', views.ReviewCreateApiView, 'api_review_create'),
+    ('reviews/draft/', views.ReviewDraftSaveApiView, 'api_review_draft_save'),
+    ('reviews/draft/retrieve/', views.ReviewDraftRetrieveApiView, 'api_review_draft_retrieve'),
+    ('reviews/draft/<str:draft_id>/delete/', views.ReviewDraftDeleteApiView, 'api_review_draft_delete'),
+    ('review/ai-rewrite/', views.ReviewAIRewriteApiView, 'api_review_ai_rewrite'),
+    ('encyclopedia/ai-prefill/', views.EncyclopediaAIPrefillApiView, 'api_encyclopedia_ai_prefill'),
+    ('encyclopedia/<int:entry_id>/edit/', views.EncyclopediaEditApiView, 'api_encyclopedia_edit'),
+    ('wishlist/bulk/', views.WishlistBulkCreateApiView, 'api_wishlist_bulk_create'),
+    ('instagram/preview/', views.InstagramPreviewApiView, 'api_instagram_preview'),
+)
+
 urlpatterns = [
-    path('', views.HomeView.as_view(), name='home'),
-    path('search/', views.GlobalSearchView.as_view(), name='global_search'),
-    path('encyclopedia/', views.EncyclopediaListView.as_view(), name='encyclopedia_list'),
-    path('encyclopedia/search/', views.EncyclopediaSearchView.as_view(), name='encyclopedia_search'),
-    path('encyclopedia/<slug:slug>/', views.EncyclopediaDetailView.as_view(), name='encyclopedia_detail'),
-    path('restaurants/', views.RestaurantListView.as_view(), name='restaurant_list'),
-    path('restaurants/new/', views.RestaurantCreateView.as_view(), name='restaurant_create'),
-    path('restaurants/<int:pk>/', views.RestaurantDetailView.as_view(), name='restaurant_detail'),
-    path('restaurants/<int:pk>/edit/', views.RestaurantUpdateView.as_view(), name='restaurant_edit'),
-    path('restaurants/<int:pk>/toggle-visited/', views.RestaurantToggleVisitedView.as_view(), name='restaurant_toggle_visited'),
-    path('restaurants/<int:pk>/dishes/add/', views.RestaurantDishCreateView.as_view(), name='restaurant_dish_create'),
-    path('restaurants/<int:pk>/dishes/<int:dish_pk>/edit/', views.RestaurantDishUpdateView.as_view(), name='restaurant_dish_update'),
-    path('restaurants/<int:pk>/dishes/<int:dish_pk>/delete/', views.RestaurantDishDeleteView.as_view(), name='restaurant_dish_delete'),
-    path('restaurants/<int:pk>/dishes/<int:dish_pk>/mark-tried/', views.RestaurantDishMarkTriedView.as_view(), name='restaurant_dish_mark_tried'),
-    path('reviews/', views.ReviewListView.as_view(), name='review_list'),
-    path('reviews/<int:pk>/', views.ReviewDetailView.as_view(), name='review_detail'),
-    path('dishes/', views.ReviewDishListView.as_view(), name='review_dish_list'),
-    path('recipes/', views.RecipeListView.as_view(), name='recipe_list'),
-    path('recipes/<slug:slug>/', views.RecipeDetailView.as_view(), name='recipe_detail'),
-    path('wishlist/add/', views.WishlistBulkPageView.as_view(), name='wishlist_bulk_add'),
-    # API endpoints
-    path('api/restaurants/search/', views.RestaurantSearchApiView.as_view(), name='api_restaurant_search'),
-    path('api/encyclopedia/search/', views.EncyclopediaSearchApiView.as_view(), name='api_encyclopedia_search'),
-    path('api/encyclopedia/suggest/', views.EncyclopediaSuggestApiView.as_view(), name='api_encyclopedia_suggest'),
-    path('api/encyclopedia/create/', views.EncyclopediaCreateApiView.as_view(), name='api_encyclopedia_create'),
-    path('api/encyclopedia/create-placeholder/', views.EncyclopediaQuickCreateApiView.as_view(), name='api_encyclopedia_quick_create'),
-    path('api/encyclopedia/<int:entry_id>/set-parent/', views.EncyclopediaParentApiView.as_view(), name='api_encyclopedia_set_parent'),
-    path('api/dishes/<int:dish_id>/link/', views.DishLinkApiView.as_view(), name='api_dish_link'),
-    path('api/dishes/<int:dish_id>/upload-image/', views.DishImageUploadApiView.as_view(), name='api_dish_image_upload'),
-    path('api/reviews/create/', ReviewCreateApiView.as_view(), name='api_review_create'),
-    path('api/reviews/draft/', ReviewDraftSaveApiView.as_view(), name='api_review_draft_save'),
-    path('api/reviews/draft/retrieve/', ReviewDraftRetrieveApiView.as_view(), name='api_review_draft_retrieve'),
-    path('api/reviews/draft/<str:draft_id>/delete/', ReviewDraftDeleteApiView.as_view(), name='api_review_draft_delete'),
-    path('api/review/ai-rewrite/', views.ReviewAIRewriteApiView.as_view(), name='api_review_ai_rewrite'),
-    path('api/encyclopedia/ai-prefill/', views.EncyclopediaAIPrefillApiView.as_view(), name='api_encyclopedia_ai_prefill'),
-    path('api/encyclopedia/<int:entry_id>/edit/', views.EncyclopediaEditApiView.as_view(), name='api_encyclopedia_edit'),
-    path('api/wishlist/bulk/', views.WishlistBulkCreateApiView.as_view(), name='api_wishlist_bulk_create'),
-    path('api/instagram/preview/', views.InstagramPreviewApiView.as_view(), name='api_instagram_preview'),
+    path(route, view.as_view(), name=name) for route, view, name in _ROUTES
+] + [
+    path(f'api/{route}', view.as_view(), name=name) for route, view, name in _API_ROUTES
 ]
@@ -10,13 +10,41 @@ Usage:
     page_content = client.get_page('103940097')
 """
 
+import html
+import json
 import requests
 import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
-from typing import Dict, List, Optional
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
 from django.conf import settings
-from html.parser import HTMLParser
+
+
+# One tag, CDATA section or comment; the text between matches is character data
+TOKEN_RE = re.compile(r'<(/?)([A-Za-z][\w:.-]*)([^>]*?)(/?)>|<!\[CDATA\[.*?\]\]>|<!--.*?-->|<![^>]*>', re.DOTALL)
+# Attribute extractors, run only against the attribute text of the tags that need them
+TIME_ATTR_RE = re.compile(r'\bdatetime="([^"]+)"')
+FILENAME_ATTR_RE = re.compile(r'\bri:filename="([^"]+)"')
+IMG_SUFFIX_RE = re.compile(r'\.(?:jpe?g|png|gif|webp|bmp)$', re.IGNORECASE)
+# Collapses runs of blank lines left behind once tags are removed
+WS_RE = re.compile(r'\n\s*\n\s*\n+')
+
+# Concurrent page fetches; requests releases the GIL while waiting on the network
+MAX_FETCH_WORKERS = 16
+MAX_DOWNLOAD_WORKERS = 8
+# Page ids per GET /pages version lookup (the endpoint's maximum page size)
+VERSION_BATCH_SIZE = 250
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# The only namespaced tags the converter acts on; the rest are stripped
+IMAGE_TAGS = {'ac:image', 'ri:attachment'}
+HEADING_TAGS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
 
 
 class ConfluenceAPIError(Exception):
@@ -24,108 +52,222 @@ class ConfluenceAPIError(Exception):
     pass
 
 
-def convert_confluence_storage_to_markdown(storage_html: str) -> str:
+def _next_cursor(data: Dict) -> Optional[str]:
+    """Return the pagination cursor from a response's next link, or None on the last page."""
+    next_url = data.get('_links', {}).get('next')
+    if not next_url:
+        return None
+    return parse_qs(urlsplit(next_url).query).get('cursor', [None])[0]
+
+
+class _StorageToMarkdown:
     """
-    Convert Confluence storage format (XML/HTML) to markdown-like text.
+    Single-pass converter from Confluence storage format to markdown-like text.
 
-    This is a simple converter that handles the basic elements we need for parsing reviews.
+    Walks the document once with TOKEN_RE, writing markdown fragments into a
+    list that is joined at the end. Headings and table cells are collected
+    into their own buffers so they can be wrapped or trimmed once their
+    closing tag is seen. Entities are left alone and decoded once at the end.
+
+    An instance can be reused for another document after reset().
     """
-    content = storage_html
-
-    # Extract datetime from <time> elements before removing them
-    # Example: <time datetime="2025-02-15" /> becomes "2025-02-15"
-    def replace_time(match):
-        datetime_attr = re.search(r'datetime="([^"]+)"', match.group(0))
-        if datetime_attr:
-            return datetime_attr.group(1)
-        return ''
-    content = re.sub(r'<time[^>]*/?>', replace_time, content)
-
-    # Extract image filenames and replace with markers
-    # Example: <ac:image>...<ri:attachment ri:filename="image.jpg" />...</ac:image>
-    # becomes: ![IMAGE:image.jpg]
-    def replace_image(match):
-        filename_match = re.search(r'ri:filename="([^"]+)"', match.group(0))
-        if filename_match:
-            return f'![IMAGE:{filename_match.group(1)}]'
-        return ''
-    content = re.sub(r'<ac:image[^>]*>.*?</ac:image>', replace_image, content, flags=re.DOTALL)
-
-    # Remove other Confluence-specific XML tags
-    content = re.sub(r'<ri:attachment[^>]*/?>', '', content)
-    content = re.sub(r'<ac:.*?>', '', content)
-    content = re.sub(r'</ac:.*?>', '', content)
-
-    # Convert headings (h1-h6)
-    # First remove strong tags inside headings to avoid double bold
-    # Add newlines before and after to ensure proper spacing
-    for i in range(1, 7):
-        content = re.sub(f'<h{i}><strong>(.*?)</strong></h{i}>', lambda m: f'\n\n{"#" * i} **{m.group(1)}**\n\n', content)
-        content = re.sub(f'<h{i}>(.*?)</h{i}>', lambda m: f'\n\n{"#" * i} **{m.group(1)}**\n\n', content)
-
-    # Convert tables to markdown-like format
-    # This is tricky - we'll do a simple conversion
-    content = convert_tables_to_markdown(content)
-
-    # Convert line breaks
-    content = content.replace('<br />', '\n')
-    content = content.replace('<br/>', '\n')
-
-    # Remove remaining HTML tags but keep content
-    content = re.sub(r'<p>(.*?)</p>', r'\1\n\n', content)
-    content = re.sub(r'<strong>(.*?)</strong>', r'**\1**', content)
-    content = re.sub(r'<em>(.*?)</em>', r'*\1*', content)
-    content = re.sub(r'<[^>]+>', '', content)
-
-    # Clean up excessive whitespace
-    content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
-
-    # Decode HTML entities
-    import html
-    content = html.unescape(content)  # This handles all HTML entities automatically
-
-    return content.strip()
-
-
-def convert_tables_to_markdown(html: str) -> str:
-    """Convert HTML tables to markdown-like pipe format"""
-    # Extract all tables
-    table_pattern = r'<table[^>]*>(.*?)</table>'
-
-    def replace_table(match):
-        table_html = match.group(1)
-
-        # Extract rows
-        row_pattern = r'<tr[^>]*>(.*?)</tr>'
-        rows = re.findall(row_pattern, table_html, re.DOTALL)
-
-        markdown_rows = []
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clear all state left over from a previous document."""
+        self._out = []
+        self._image_depth = 0
+        self._image_filename = None
+        self._heading_level = None
+        self._heading_parts = None
+        self._table_depth = 0
+        self._rows = None
+        self._row = None
+        self._row_has_bold = False
+        self._cell = None
+
+    def _emit(self, text: str):
+        if self._heading_parts is not None:
+            self._heading_parts.append(text)
+        elif self._cell is not None:
+            self._cell.append(text)
+        elif not self._table_depth:
+            # Anything between table cells is dropped
+            self._out.append(text)
+
+    def feed(self, data: str):
+        # split() yields text, then the four TOKEN_RE groups, repeating
+        parts = TOKEN_RE.split(data)
+        handle_data = self.handle_data
+        for i in range(0, len(parts), 5):
+            if parts[i]:
+                handle_data(parts[i])
+            tag = parts[i + 2] if i + 2 < len(parts) else None
+            if tag is None:
+                # CDATA, comments and declarations carry no review text
+                continue
+            if ':' in tag and tag not in IMAGE_TAGS:
+                # Other Confluence macro/resource tags (<ac:...>, <ri:...>) are
+                # stripped, keeping only the text between them
+                continue
+            if parts[i + 1]:
+                self.handle_endtag(tag)
+            else:
+                # Self-closing tags (<br />, <time ... />, <ri:attachment ... />) have no end handling
+                self.handle_starttag(tag, parts[i + 3])
+
+    def handle_starttag(self, tag, attrs):
+        if self._image_depth:
+            if tag == 'ac:image':
+                self._image_depth += 1
+            elif tag == 'ri:attachment' and self._image_filename is None:
+                filename_match = FILENAME_ATTR_RE.search(attrs)
+                self._image_filename = filename_match.group(1) if filename_match else None
+            return
+
+        if tag == 'ac:image':
+            # <ac:image>...<ri:attachment ri:filename="image.jpg" />...</ac:image>
+            # becomes: ![IMAGE:image.jpg]
+            self._image_depth = 1
+            self._image_filename = None
+        elif tag == 'time':
+            # <time datetime="2025-02-15" /> becomes "2025-02-15"
+            datetime_match = TIME_ATTR_RE.search(attrs)
+            if datetime_match:
+                self._emit(datetime_match.group(1))
+        elif tag in HEADING_TAGS and self._heading_parts is None and self._cell is None:
+            self._heading_level = HEADING_TAGS[tag]
+            self._heading_parts = []
+        elif tag == 'table':
+            if not self._table_depth:
+                self._rows = []
+            self._table_depth += 1
+        elif tag == 'tr' and self._table_depth:
+            self._end_row()
+            self._row = []
+        elif tag in ('th', 'td') and self._table_depth:
+            self._end_cell()
+            self._cell = []
+        elif tag == 'br':
+            self._emit('' if self._cell is not None else '\n')
+        elif tag == 'strong':
+            # Strong tags inside headings are dropped to avoid double bold
+            self._emit('' if self._heading_parts is not None else '**')
+            if self._cell is not None:
+                self._row_has_bold = True
+        elif tag == 'em':
+            self._emit('' if self._cell is not None else '*')
+
+    def handle_endtag(self, tag):
+        if self._image_depth:
+            if tag == 'ac:image':
+                self._image_depth -= 1
+                if not self._image_depth and self._image_filename:
+                    self._emit(f'![IMAGE:{self._image_filename}]')
+            return
+
+        if tag in HEADING_TAGS and HEADING_TAGS[tag] == self._heading_level:
+            self._end_heading()
+        elif tag == 'table' and self._table_depth:
+            self._table_depth -= 1
+            if not self._table_depth:
+                self._end_table()
+        elif tag == 'tr' and self._table_depth:
+            self._end_row()
+        elif tag in ('th', 'td') and self._table_depth:
+            self._end_cell()
+        elif tag == 'p':
+            self._emit('' if self._cell is not None else '\n\n')
+        elif tag == 'strong':
+            self._emit('' if self._heading_parts is not None else '**')
+            if self._cell is not None:
+                self._row_has_bold = True
+        elif tag == 'em':
+            self._emit('' if self._cell is not None else '*')
+
+    def handle_data(self, data):
+        if not self._image_depth:
+            if self._cell is not None and '**' in data:
+                self._row_has_bold = True
+            self._emit(data)
+
+    def _end_heading(self):
+        text = ''.join(self._heading_parts).strip()
+        level = self._heading_level
+        self._heading_level = None
+        self._heading_parts = None
+        # Add newlines before and after to ensure proper spacing
+        self._emit(f'\n\n{"#" * level} **{text}**\n\n')
+
+    def _end_cell(self):
+        if self._cell is None:
+            return
+        cell_text = ''.join(self._cell).strip()
+        self._cell = None
+        if self._row is None:
+            self._row = []
+        self._row.append(cell_text)
+
+    def _end_row(self):
+        self._end_cell()
+        if self._row:
+            markdown_row = '| ' + ' | '.join(self._row) + ' |'
+            self._rows.append(markdown_row)
+            # Add separator after header row if cells contain **
+            if self._row_has_bold:
+                self._rows.append('| ' + ' | '.join(['---'] * len(self._row)) + ' |')
+        self._row = None
+        self._row_has_bold = False
+
+    def _end_table(self):
+        self._end_row()
+        rows = self._rows
+        self._rows = None
+        # Rows go straight into the output list rather than via a joined copy
+        self._emit('\n')
         for row in rows:
-            # Extract cells (th or td)
-            cell_pattern = r'<t[hd][^>]*>(.*?)</t[hd]>'
-            cells = re.findall(cell_pattern, row, re.DOTALL)
+            self._emit(row)
+            self._emit('\n')
+
+    def result(self) -> str:
+        """Return the converted text for everything fed so far."""
+        # Flush anything left open by malformed markup
+        if self._heading_parts is not None:
+            self._end_heading()
+        if self._table_depth:
+            self._table_depth = 0
+            self._end_table()
+
+        content = ''.join(self._out)
+
+        # Clean up excessive whitespace
+        content = WS_RE.sub('\n\n', content)
+
+        # Decode HTML entities
+        content = html.unescape(content)  # This handles all HTML entities automatically
+
+        return content.strip()
 
-            # Clean cell content
-            cleaned_cells = []
-            for cell in cells:
-                # Remove inner tags but keep content
-                cell_text = re.sub(r'<p>(.*?)</p>', r'\1', cell)
-                cell_text = re.sub(r'<strong>(.*?)</strong>', r'**\1**', cell_text)
-                cell_text = re.sub(r'<[^>]+>', '', cell_text)
-                cell_text = cell_text.strip()
-                cleaned_cells.append(cell_text)
 
-            # Build markdown row
-            if cleaned_cells:
-                markdown_row = '| ' + ' | '.join(cleaned_cells) + ' |'
-                markdown_rows.append(markdown_row)
-                # Add separator after header row if cells contain **
-                if any('**' in cell for cell in cleaned_cells):
-                    markdown_rows.append('| ' + ' | '.join(['---'] * len(cleaned_cells)) + ' |')
+_CONVERTERS = threading.local()
 
-        return '\n' + '\n'.join(markdown_rows) + '\n'
 
-    return re.sub(table_pattern, replace_table, html, flags=re.DOTALL)
+def convert_confluence_storage_to_markdown(storage_html: str) -> str:
+    """
+    Convert Confluence storage format (XML/HTML) to markdown-like text.
+
+    This is a simple converter that handles the basic elements we need for parsing reviews.
+    """
+    # Pages are converted from fetch worker threads, so each thread reuses its own converter
+    parser = getattr(_CONVERTERS, 'parser', None)
+    if parser is None:
+        parser = _CONVERTERS.parser = _StorageToMarkdown()
+    else:
+        parser.reset()
+    parser.feed(storage_html)
+    return parser.result()
 
 
 class ConfluenceClient:
@@ -135,7 +277,8 @@ class ConfluenceClient:
         self,
         email: Optional[str] = None,
         api_token: Optional[str] = None,
-        site_url: Optional[str] = None
+        site_url: Optional[str] = None,
+        page_cache_dir: Optional[Path] = None
     ):
         """
         Initialize Confluence API client.
@@ -144,11 +287,18 @@ class ConfluenceClient:
             email: Atlassian account email (defaults to CONFLUENCE_EMAIL setting)
             api_token: Atlassian API token (defaults to CONFLUENCE_API_TOKEN setting)
             site_url: Confluence site URL (defaults to CONFLUENCE_SITE_URL setting)
+            page_cache_dir: Directory for caching page content between runs
+                (defaults to CONFLUENCE_PAGE_CACHE_DIR setting; None disables it)
         """
         self.email = email or getattr(settings, 'CONFLUENCE_EMAIL', None)
         self.api_token = api_token or getattr(settings, 'CONFLUENCE_API_TOKEN', None)
         self.site_url = (site_url or getattr(settings, 'CONFLUENCE_SITE_URL', 'https://gavinlu.atlassian.net')).rstrip('/')
 
+        cache_dir = page_cache_dir or getattr(settings, 'CONFLUENCE_PAGE_CACHE_DIR', None)
+        self.page_cache_dir = Path(cache_dir) if cache_dir else None
+        # page_id -> (version number, page data)
+        self._page_cache: Dict[str, Tuple[int, Dict]] = {}
+
         if not self.email or not self.api_token:
             raise ConfluenceAPIError(
                 'Confluence credentials not configured. '
@@ -158,6 +308,18 @@ class ConfluenceClient:
         self.auth = HTTPBasicAuth(self.email, self.api_token)
         self.base_url = f'{self.site_url}/wiki/api/v2'
 
+        # Shared session so every call (and every fetch thread) reuses pooled
+        # keep-alive connections instead of a new TCP/TLS handshake per request
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=5, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
         """
         Make a request to the Confluence API.
@@ -176,7 +338,7 @@ class ConfluenceClient:
         url = f'{self.base_url}{endpoint}'
 
         try:
-            response = requests.request(method, url, auth=self.auth, **kwargs)
+            response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -196,6 +358,78 @@ class ConfluenceClient:
         """
         return self._request('GET', f'/pages/{page_id}', params={'body-format': 'storage'})
 
+    def get_page_versioned(self, page_id: str, version: Optional[int]) -> Dict:
+        """
+        Get a single page, reusing cached content if the version is unchanged.
+
+        The version number comes from get_page_versions, so an unchanged page
+        is served from memory or the on-disk page cache without fetching its
+        body. Without a version the page is always fetched.
+
+        Args:
+            page_id: Confluence page ID
+            version: Current version number of the page, if known
+
+        Returns:
+            Dictionary containing page data with 'body' field
+        """
+        cache_file = self.page_cache_dir / f'{page_id}.json' if self.page_cache_dir else None
+
+        if version is not None:
+            cached = self._page_cache.get(page_id)
+            if cached is None and cache_file is not None and cache_file.exists():
+                try:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        stored = json.load(f)
+                    cached = (stored['version'], stored['page'])
+                except (OSError, ValueError, KeyError):
+                    cached = None
+            if cached is not None and cached[0] == version:
+                self._page_cache[page_id] = cached
+                return cached[1]
+
+        page = self.get_page(page_id)
+        page_version = page.get('version', {}).get('number', version)
+        if page_version is not None:
+            self._page_cache[page_id] = (page_version, page)
+            if cache_file is not None:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump({'version': page_version, 'page': page}, f)
+        return page
+
+    def get_page_versions(self, page_ids: List[str]) -> Dict[str, int]:
+        """
+        Get the current version number of each page, without body content.
+
+        Descendant listings carry no version, so this looks the pages up
+        through GET /pages in batches of VERSION_BATCH_SIZE ids.
+
+        Args:
+            page_ids: Confluence page IDs
+
+        Returns:
+            Dictionary mapping page ID to version number
+        """
+        versions = {}
+        for start in range(0, len(page_ids), VERSION_BATCH_SIZE):
+            params = {'id': ','.join(page_ids[start:start + VERSION_BATCH_SIZE]), 'limit': VERSION_BATCH_SIZE}
+            while True:
+                data = self._request('GET', '/pages', params=params)
+
+                for page in data.get('results', []):
+                    number = page.get('version', {}).get('number')
+                    if number is not None:
+                        versions[str(page['id'])] = number
+
+                # Continue with the cursor from the next link, if any
+                cursor = _next_cursor(data)
+                if not cursor:
+                    break
+                params['cursor'] = cursor
+
+        return versions
+
     def get_page_descendants(
         self,
         page_id: str,
@@ -229,13 +463,8 @@ class ConfluenceClient:
             results = data.get('results', [])
             all_descendants.extend(results)
 
-            # Check if there are more pages
-            links = data.get('_links', {})
-            if 'next' not in links:
-                break
-
-            # Extract cursor from next link if pagination continues
-            cursor = data.get('_links', {}).get('next', '').split('cursor=')[-1] if 'next' in links else None
+            # Continue with the cursor from the next link, if any
+            cursor = _next_cursor(data)
             if not cursor:
                 break
 
@@ -269,32 +498,52 @@ class ConfluenceClient:
         # Filter for depth 2 pages (actual restaurant reviews)
         review_pages = [page for page in descendants if page.get('depth') == 2]
 
-        # Fetch full content for each review page
-        reviews_with_content = []
-        for page in review_pages:
-            try:
-                # Get full page content
-                full_page = self.get_page(page['id'])
-
-                # Extract body content in storage format (HTML/XML)
-                storage_body = full_page.get('body', {}).get('storage', {}).get('value', '')
-
-                # Convert Confluence storage format to markdown-like text
-                markdown_body = convert_confluence_storage_to_markdown(storage_body)
-
-                reviews_with_content.append({
-                    'id': page['id'],
-                    'title': page['title'],
-                    'body': markdown_body,
-                    'parent_id': page.get('parentId'),
-                    'parent_title': page.get('parentTitle', ''),
-                })
-            except ConfluenceAPIError as e:
-                # Log error but continue with other pages
-                print(f'Warning: Failed to fetch page {page["id"]} ({page["title"]}): {str(e)}')
-                continue
+        # Unchanged pages are served from the page cache by version
+        try:
+            versions = self.get_page_versions([page['id'] for page in review_pages])
+        except ConfluenceAPIError as e:
+            print(f'Warning: Failed to fetch page versions, fetching every page: {str(e)}')
+            versions = {}
+
+        # Fetch full content for each review page in parallel
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            results = executor.map(
+                self._fetch_one_review, review_pages, [versions.get(page['id']) for page in review_pages]
+            )
+            return [review for review in results if review is not None]
+
+    def _fetch_one_review(self, page: Dict, version: Optional[int] = None) -> Optional[Dict]:
+        """
+        Fetch and convert a single review page for get_restaurant_reviews.
 
-        return reviews_with_content
+        Args:
+            page: Descendant listing entry for the page
+            version: Current version number of the page, if known
+
+        Returns:
+            Review dictionary, or None if the page could not be fetched
+        """
+        try:
+            # Get full page content
+            full_page = self.get_page_versioned(page['id'], version)
+        except ConfluenceAPIError as e:
+            # Log error but continue with other pages
+            print(f'Warning: Failed to fetch page {page["id"]} ({page["title"]}): {str(e)}')
+            return None
+
+        # Extract body content in storage format (HTML/XML)
+        storage_body = full_page.get('body', {}).get('storage', {}).get('value', '')
+
+        # Convert Confluence storage format to markdown-like text
+        markdown_body = convert_confluence_storage_to_markdown(storage_body)
+
+        return {
+            'id': page['id'],
+            'title': page['title'],
+            'body': markdown_body,
+            'parent_id': page.get('parentId'),
+            'parent_title': page.get('parentTitle', ''),
+        }
 
     def get_attachments(self, page_id: str) -> List[Dict]:
         """
@@ -319,18 +568,20 @@ class ConfluenceClient:
             results = data.get('results', [])
             all_attachments.extend(results)
 
-            # Check for pagination
-            links = data.get('_links', {})
-            if 'next' not in links:
-                break
-
-            cursor = data.get('_links', {}).get('next', '').split('cursor=')[-1] if 'next' in links else None
+            # Continue with the cursor from the next link, if any
+            cursor = _next_cursor(data)
             if not cursor:
                 break
 
         return all_attachments
 
-    def download_attachment(self, page_id: str, filename: str, output_path: Path) -> bool:
+    def download_attachment(
+        self,
+        page_id: str,
+        filename: str,
+        output_path: Path,
+        attachments: Optional[List[Dict]] = None
+    ) -> bool:
         """
         Download an attachment from a Confluence page.
 
@@ -338,13 +589,16 @@ class ConfluenceClient:
             page_id: Confluence page ID
             filename: Attachment filename
             output_path: Local path to save the file
+            attachments: Page attachments already fetched with get_attachments
+                (fetched here if not given)
 
         Returns:
             True if download succeeded, False otherwise
         """
         try:
             # Get attachments for the page
-            attachments = self.get_attachments(page_id)
+            if attachments is None:
+                attachments = self.get_attachments(page_id)
 
             # Find the matching attachment
             attachment = None
@@ -368,16 +622,16 @@ class ConfluenceClient:
                 download_url = f'{self.site_url}/wiki{download_url}'
 
             # Download the file
-            response = requests.get(download_url, auth=self.auth, stream=True)
+            response = self.session.get(download_url, stream=True)
             response.raise_for_status()
 
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write file
+            # Write file, copying straight from the raw stream in 64 KiB blocks
+            response.raw.decode_content = True
             with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
 
             return True
 
@@ -402,25 +656,46 @@ class ConfluenceClient:
             attachments = self.get_attachments(page_id)
 
             # Filter for image files
-            image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'}
             image_attachments = [
                 att for att in attachments
-                if Path(att.get('title', '')).suffix.lower() in image_extensions
+                if IMG_SUFFIX_RE.search(att.get('title', ''))
             ]
 
-            for attachment in image_attachments:
-                filename = attachment.get('title')
-                if not filename:
-                    continue
-
-                output_path = output_dir / filename
-                if self.download_attachment(page_id, filename, output_path):
-                    # Return relative path from MEDIA_ROOT
-                    media_root = Path(settings.MEDIA_ROOT)
-                    relative_path = output_path.relative_to(media_root)
-                    downloaded[filename] = str(relative_path).replace('\\', '/')
+            # Download in parallel over the session's connection pool
+            with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+                results = executor.map(
+                    lambda attachment: self._download_one(page_id, attachment, output_dir, attachments),
+                    image_attachments,
+                )
+                downloaded.update(result for result in results if result is not None)
 
         except Exception as e:
             print(f'Error downloading images for page {page_id}: {str(e)}')
 
         return downloaded
+
+    def _download_one(
+        self,
+        page_id: str,
+        attachment: Dict,
+        output_dir: Path,
+        attachments: List[Dict]
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Download one image attachment for download_page_images.
+
+        Returns:
+            (filename, path relative to MEDIA_ROOT), or None if the download failed
+        """
+        filename = attachment.get('title')
+        if not filename:
+            return None
+
+        output_path = output_dir / filename
+        if not self.download_attachment(page_id, filename, output_path, attachments):
+            return None
+
+        # Return relative path from MEDIA_ROOT
+        media_root = Path(settings.MEDIA_ROOT)
+        relative_path = output_path.relative_to(media_root)
+        return filename, str(relative_path).replace('\\', '/')
@@ -1,6 +1,22 @@
+from django.db import connection
+from django.db.models import Count, Max, Q
+from django.utils.text import slugify
+
 from content.models import Encyclopedia
 
 
+# Optional text fields the create and edit APIs accept, with whether an
+# empty value is stored as None (the nullable classification fields) or ''
+OPTIONAL_TEXT_FIELDS = (
+    ('cuisine_type', True),
+    ('dish_category', True),
+    ('region', True),
+    ('cultural_significance', False),
+    ('popular_examples', False),
+    ('history', False),
+)
+
+
 def build_encyclopedia_tree():
     """
     Fetch all encyclopedia entries in a single query and build the full tree in memory.
@@ -13,7 +29,13 @@ def build_encyclopedia_tree():
 
     Returns (roots, max_depth) where roots is the ordered list of root entries.
     """
-    all_entries = list(Encyclopedia.objects.order_by('name'))
+    # Only the columns the tree templates and breadcrumbs read; the long text
+    # fields, metadata and search vector stay in the database
+    all_entries = list(
+        Encyclopedia.objects
+        .only('id', 'name', 'slug', 'description', 'is_placeholder', 'parent')
+        .order_by('name')
+    )
 
     entry_map = {e.id: e for e in all_entries}
 
@@ -41,17 +63,99 @@ def build_encyclopedia_tree():
 
     roots = [e for e in all_entries if e.parent_id is None and visible(e)]
 
+    # Breadth-first from the roots, so deep trees cannot hit the recursion limit
     max_depth = 0
+    level = roots
+    depth = 0
+    while level:
+        next_level = []
+        for entry in level:
+            entry.depth = depth
+            next_level.extend(entry.tree_children)
+        max_depth = depth
+        level = next_level
+        depth += 1
 
-    def annotate_depth(entry, depth):
-        nonlocal max_depth
-        entry.depth = depth
-        if depth > max_depth:
-            max_depth = depth
-        for child in entry.tree_children:
-            annotate_depth(child, depth + 1)
+    return roots, max_depth
 
-    for root in roots:
-        annotate_depth(root, 0)
 
-    return roots, max_depth
+def encyclopedia_tree_etag(request, *args, **kwargs):
+    """
+    ETag for pages built only from Encyclopedia rows, such as the tree list.
+
+    Any save bumps updated_at (bulk update() callers such as the admin
+    placeholder actions set it explicitly) and any delete changes the count,
+    so one aggregate query tells whether the page could differ. The user is part of
+    the tag because staff see extra content and the page carries their
+    session's navigation and CSRF token.
+    """
+    stats = Encyclopedia.objects.aggregate(last_updated=Max('updated_at'), count=Count('id'))
+    last_updated = stats['last_updated'].timestamp() if stats['last_updated'] else 0
+    return f"{request.user.pk}-{int(request.user.is_staff)}-{stats['count']}-{last_updated}"
+
+
+def unique_encyclopedia_slug(name, exclude_pk=None):
+    """
+    Return slugify(name), or the first free "<slug>-<n>" if it is taken.
+
+    All slugs that could collide are read in one query, instead of one
+    exists() query per numbered attempt.
+
+    Args:
+        name: Entry name to build the slug from
+        exclude_pk: Entry to ignore, so an entry keeps its own slug on rename
+    """
+    base_slug = slugify(name)
+    taken = Encyclopedia.objects.filter(Q(slug=base_slug) | Q(slug__startswith=f'{base_slug}-'))
+    if exclude_pk is not None:
+        taken = taken.exclude(pk=exclude_pk)
+    taken = set(taken.values_list('slug', flat=True))
+
+    slug = base_slug
+    counter = 1
+    while slug in taken:
+        slug = f"{base_slug}-{counter}"
+        counter += 1
+    return slug
+
+
+def build_hierarchy_breadcrumbs(entries, separator=' > '):
+    """
+    Return {entry.id: entry.get_hierarchy_breadcrumb(separator)} for a list of entries.
+
+    The ancestors of every entry are loaded together in one recursive query
+    of (id, parent_id, name) rows, instead of one query per entry.
+    """
+    parent_ids = {e.parent_id for e in entries if e.parent_id is not None}
+    nodes = {}
+    if parent_ids:
+        table = Encyclopedia._meta.db_table
+        with connection.cursor() as cursor:
+            # UNION (not UNION ALL) drops repeated rows, so a cycle ends the walk
+            cursor.execute(
+                f"""
+                WITH RECURSIVE chain AS (
+                    SELECT id, parent_id, name FROM {table} WHERE id = ANY(%s)
+                    UNION
+                    SELECT e.id, e.parent_id, e.name
+                    FROM {table} e
+                    JOIN chain c ON e.id = c.parent_id
+                )
+                SELECT id, parent_id, name FROM chain
+                """,
+                [list(parent_ids)],
+            )
+            nodes = {node_id: (parent_id, name) for node_id, parent_id, name in cursor.fetchall()}
+
+    breadcrumbs = {}
+    for entry in entries:
+        names = []
+        visited = set()
+        node_id = entry.parent_id
+        while node_id in nodes and node_id not in visited:
+            visited.add(node_id)
+            node_id, name = nodes[node_id]
+            names.append(name)
+        names.reverse()  # Root -> parent order
+        breadcrumbs[entry.id] = separator.join(names)
+    return breadcrumbs
@@ -2,11 +2,12 @@
 Importer for fetching reviews directly from Confluence REST API.
 """
 
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
 from datetime import datetime
 
 from .base import BaseImporter
-from content.utils.confluence_api import ConfluenceClient, ConfluenceAPIError
+from content.utils.confluence_api import ConfluenceClient, ConfluenceAPIError, MAX_FETCH_WORKERS
 
 
 class ConfluenceAPIImporter(BaseImporter):
@@ -42,57 +43,37 @@ class ConfluenceAPIImporter(BaseImporter):
 
         print(f'Found {len(main_reviews)} main review pages, checking for follow-up visits...')
 
-        followup_count = 0
-        for main_review in main_reviews:
-            try:
-                # Get children of this review page
-                children = self.client.get_page_descendants(main_review['id'])
-                if children:
-                    followup_count += len(children)
-                    # Mark these as followups with depth 3
-                    for child in children:
-                        child['depth'] = 3
-                        child['is_followup'] = True
-                    all_review_pages.extend(children)
-            except ConfluenceAPIError as e:
-                print(f'Warning: Failed to fetch children of {main_review["id"]}: {str(e)}')
-                continue
-
-        print(f'Found {followup_count} follow-up visit pages')
+        # Descendants are returned recursively, so a page nested under another
+        # known page is already covered by that page's lookup
+        known_ids = {page['id'] for page in main_reviews}
+        subtree_roots = [page for page in main_reviews if page.get('parentId') not in known_ids]
 
-        # Fetch full content for each review page (deduplicate by page ID)
-        reviews_with_content = []
-        seen_ids = set()
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            followup_count = 0
+            for children in executor.map(self._fetch_children, subtree_roots):
+                # Deduplicate by page ID before the expensive full-content fetch
+                new_children = [child for child in children if child['id'] not in known_ids]
+                known_ids.update(child['id'] for child in new_children)
+                followup_count += len(new_children)
+                all_review_pages.extend(new_children)
 
-        for page in all_review_pages:
-            page_id = page['id']
-
-            # Skip duplicates
-            if page_id in seen_ids:
-                continue
-            seen_ids.add(page_id)
+            print(f'Found {followup_count} follow-up visit pages')
 
+            # Unchanged pages are served from the page cache by version
             try:
-                # Get full page content
-                full_page = self.client.get_page(page_id)
-
-                # Extract body content in storage format (HTML/XML)
-                storage_body = full_page.get('body', {}).get('storage', {}).get('value', '')
-
-                reviews_with_content.append({
-                    'id': page_id,
-                    'title': page['title'],
-                    'body': storage_body,
-                    'parent_id': page.get('parentId'),
-                    'parent_title': page.get('parentTitle', ''),
-                    'format': 'storage',  # Indicates HTML/XML format from Confluence
-                    'depth': page.get('depth'),  # Include depth to distinguish main vs follow-up
-                    'is_followup': page.get('is_followup', page.get('depth') == 3),  # Flag for follow-up visits
-                })
+                versions = self.client.get_page_versions([page['id'] for page in all_review_pages])
             except ConfluenceAPIError as e:
-                # Log error but continue with other pages
-                print(f'Warning: Failed to fetch page {page_id} ({page["title"]}): {str(e)}')
-                continue
+                print(f'Warning: Failed to fetch page versions, fetching every page: {str(e)}')
+                versions = {}
+
+            # Fetch full content for each review page
+            reviews_with_content = [
+                review for review in executor.map(
+                    self._fetch_one_review, all_review_pages,
+                    [versions.get(page['id']) for page in all_review_pages]
+                )
+                if review is not None
+            ]
 
         # Store source info for later
         self._source_info = {
@@ -103,6 +84,54 @@ class ConfluenceAPIImporter(BaseImporter):
 
         return reviews_with_content
 
+    def _fetch_children(self, main_review: Dict) -> List[Dict]:
+        """Get the follow-up visit pages (children) of a main review page."""
+        try:
+            children = self.client.get_page_descendants(main_review['id'])
+        except ConfluenceAPIError as e:
+            print(f'Warning: Failed to fetch children of {main_review["id"]}: {str(e)}')
+            return []
+
+        # Mark these as followups with depth 3
+        for child in children:
+            child['depth'] = 3
+            child['is_followup'] = True
+        return children
+
+    def _fetch_one_review(self, page: Dict, version: Optional[int] = None) -> Optional[Dict]:
+        """
+        Fetch the full storage-format content of a single review page.
+
+        Args:
+            page: Descendant listing entry for the page
+            version: Current version number of the page, if known
+
+        Returns:
+            Review dictionary, or None if the page could not be fetched
+        """
+        page_id = page['id']
+        try:
+            # Get full page content
+            full_page = self.client.get_page_versioned(page_id, version)
+        except ConfluenceAPIError as e:
+            # Log error but continue with other pages
+            print(f'Warning: Failed to fetch page {page_id} ({page["title"]}): {str(e)}')
+            return None
+
+        # Extract body content in storage format (HTML/XML)
+        storage_body = full_page.get('body', {}).get('storage', {}).get('value', '')
+
+        return {
+            'id': page_id,
+            'title': page['title'],
+            'body': storage_body,
+            'parent_id': page.get('parentId'),
+            'parent_title': page.get('parentTitle', ''),
+            'format': 'storage',  # Indicates HTML/XML format from Confluence
+            'depth': page.get('depth'),  # Include depth to distinguish main vs follow-up
+            'is_followup': page.get('is_followup', page.get('depth') == 3),  # Flag for follow-up visits
+        }
+
     def get_source_info(self) -> Dict:
         """Get metadata about the Confluence API source"""
         if self._source_info is None:
@@ -2,11 +2,11 @@
 Importer for loading reviews from JSON export files.
 """
 
-import json
 from pathlib import Path
 from typing import List, Dict
 
 from .base import BaseImporter
+from content.utils.json_api import loads
 
 
 class JSONFileImporter(BaseImporter):
@@ -22,6 +22,13 @@ class JSONFileImporter(BaseImporter):
         self.json_path = json_path
         self._data = None
 
+    def _load(self) -> Dict:
+        """Read and parse the JSON file, at most once per importer."""
+        if self._data is None:
+            with open(self.json_path, 'rb') as f:
+                self._data = loads(f.read())
+        return self._data
+
     def fetch_reviews(self) -> List[Dict]:
         """
         Load restaurant review pages from JSON file.
@@ -29,10 +36,7 @@ class JSONFileImporter(BaseImporter):
         Returns:
             List of page dictionaries with 'markdown' format content
         """
-        with open(self.json_path, 'r', encoding='utf-8') as f:
-            self._data = json.load(f)
-
-        pages = self._data.get('pages', [])
+        pages = self._load().get('pages', [])
 
         # Add format indicator to each page
         for page in pages:
@@ -42,12 +46,7 @@ class JSONFileImporter(BaseImporter):
 
     def get_source_info(self) -> Dict:
         """Get metadata about the JSON file source"""
-        if self._data is None:
-            # Load data if not already loaded
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                self._data = json.load(f)
-
-        return self._data.get('export_info', {
+        return self._load().get('export_info', {
             'source': f'JSON file: {self.json_path.name}',
             'total_pages': 0,
         })
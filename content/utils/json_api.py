@@ -0,0 +1,51 @@
+"""
+JSON parsing and responses for the API views and importers, using orjson when
+it is installed.
+"""
+
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Types orjson does not handle natively (Decimal, lazy strings, ...) are
+# encoded the way JsonResponse would encode them
+_DJANGO_DEFAULT = DjangoJSONEncoder().default
+
+
+def loads(data):
+    """
+    Parse JSON text or bytes (a request body, an export file, ...).
+
+    Invalid JSON raises json.JSONDecodeError with either backend
+    (orjson.JSONDecodeError subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data) -> bytes:
+    """Serialize data to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_DJANGO_DEFAULT, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, cls=DjangoJSONEncoder).encode()
+
+
+class FastJsonResponse(HttpResponse):
+    """
+    Drop-in replacement for JsonResponse that serializes with orjson.
+
+    Takes the same data and keyword arguments (status, headers, ...) as
+    HttpResponse, with the content type defaulting to application/json.
+    """
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=dumps(data), **kwargs)
@@ -9,7 +9,7 @@ from datetime import date, time
 from decimal import Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedDish:
     """Represents a parsed dish from a review"""
     name: str
@@ -19,7 +19,7 @@ class ParsedDish:
     images: List[str] = field(default_factory=list)  # List of image paths
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedReviewData:
     """Represents parsed review data ready for database import"""
     restaurant_name: str
@@ -2,21 +2,198 @@
 Parser for Confluence markdown format (from JSON exports or MCP tools).
 """
 
+import calendar
 import re
-from typing import Optional, List, Dict
-from datetime import datetime, time
+from functools import lru_cache
+from typing import Optional, List, Dict, Tuple
+from datetime import date, datetime, time
 from decimal import Decimal
 
 from .base import BaseParser, ParsedReviewData, ParsedDish
 
 
+# Patterns are compiled once at import; parse() runs them for every page of a bulk import
+_TABLE_ROW_RE = re.compile(r'\|.*\|')
+_HEADING_RE = re.compile(r'#\s+')
+_ADDRESS_RE = re.compile(r'\|\s*Address\s*\|\s*([^\|]+)\s*\|', re.IGNORECASE)
+_DATE_RE = re.compile(r'\|\s*Date\s*\|\s*(?:<custom[^>]*>)?([0-9]{1,2}[\/\-][0-9]{1,2}[\/\-][0-9]{2,4}|[A-Za-z]+\s+[0-9]{1,2}\s+[0-9]{4}|[0-9]{4}-[0-9]{2}-[0-9]{2})', re.IGNORECASE)
+_TIME_RE = re.compile(r'\|\s*Time of Entry\s*\|\s*([0-9]{1,2}:[0-9]{2}\s*(?:AM|PM)?)', re.IGNORECASE)
+_PARTY_RE = re.compile(r'\|\s*Party\s*\|\s*([^\|]+)\s*\|', re.IGNORECASE)
+_WEBSITE_RE = re.compile(r'\|\s*Website\s*\|.*?https?://([^\s<\|]+)', re.IGNORECASE)
+_OVERALL_RATING_RE = re.compile(r'\*\*Overall Rating\s*-\s*(\d+)(?:/100)?\*\*', re.IGNORECASE)
+_TABLE_RATING_RE = re.compile(r'\|\s*\*\*Rating\*\*\s*\|\s*(\d+)\s*\|')
+_COST_RE = re.compile(r'\|\s*\*\*Cost\*\*\s*\|\s*\$?\s*([0-9.]+)\s*\|')
+_IMAGE_MARKER_RE = re.compile(r'!\[IMAGE:([^\]]+)\]')
+_FREEFORM_RE = re.compile(r'(.*?)(?=\*\*Overall Rating)', re.DOTALL)
+_STRUCTURED_RE = re.compile(r'\*\*(?:Texture|Taste|Presentation)\s*-')
+_STRUCTURED_SECTION_RE = re.compile(r'\*\*(Texture|Taste|Presentation)\s*-\s*([0-9.]+/5)\*\*\s*\n\s*(.*?)(?=\n\*\*|\Z)', re.DOTALL)
+_STRUCTURED_LABELS = ('Texture', 'Taste', 'Presentation')
+_ZWNJ_RE = re.compile(r'\u200c')
+# Markup stripped from the visit notes in one pass: zero-width spaces, HTML tags and images
+_NOTES_MARKUP_RE = re.compile(r'\u200c|<[^>]+>|!\[.*?\]\(.*?\)')
+# Image markers (![IMAGE:filename]) and other image references in dish text
+_IMAGES_RE = re.compile(r'!\[IMAGE:[^\]]+\]|!\[.*?\]\(.*?\)')
+_TABLE_FRAGMENT_RE = re.compile(r'(?:[A-Z][a-z]{0,3}\s*)?\n(?:\|[^\n]*\|\s*\n)+')
+_SEPARATOR_FRAGMENT_RE = re.compile(r'.*?---.*?\|.*?')
+_SEPARATOR_ROW_RE = re.compile(r'\|\s*---.*')
+_EXCESS_NEWLINES_RE = re.compile(r'\n\s*\n\s*\n+')
+_CLOCK_RE = re.compile(r'(\d{1,2}):(\d{2})\s*(AM|PM)?')
+_DIGITS_RE = re.compile(r'\d+')
+_WORD_RE = re.compile(r'[a-z]+')
+
+# Line kinds yielded by ConfluenceMarkdownParser._tokenize
+_LINE_TEXT = 'text'
+_LINE_DISH = 'dish'
+# Start of a dish heading line: '# **', '## **', ... (the storage converter emits any <hN> level)
+_DISH_HEADING_RE = re.compile(r'#{1,6}[ \t]*\*\*')
+
+# Dates as strptime would accept them for %m/%d/%Y, %m-%d-%Y, %Y-%m-%d and %B/%b %d %Y
+_DATE_VALUE_RE = re.compile(
+    r'(?P<m1>\d{1,2})(?P<sep>[/-])(?P<d1>\d{1,2})(?P=sep)(?P<y1>\d{4})'
+    r'|(?P<y2>\d{4})-(?P<m2>\d{1,2})-(?P<d2>\d{1,2})'
+    r'|(?P<mon3>[A-Za-z]+)\s+(?P<d3>\d{1,2})\s+(?P<y3>\d{4})',
+    re.ASCII
+)
+_MONTHS = {
+    name.lower(): number
+    for names in (calendar.month_name, calendar.month_abbr)
+    for number, name in enumerate(names) if name
+}
+
+# Party sizes written as words; "Self" means a solo visit
+_PARTY_WORDS = {
+    'self': 1, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10
+}
+
+
+# Visit tables repeat the same few date, time and party strings across a
+# bulk import, so the parsed values are cached by their source string.
+def _split_numeric_date(date_str: str) -> Optional[Tuple[str, str, str]]:
+    """Split m/d/Y or Y-m-d into (year, month, day) digit strings, or return None"""
+    if not date_str.isascii():
+        return None
+    if '/' in date_str:
+        parts = date_str.split('/')
+        if len(parts) == 3:
+            month, day, year = parts
+            if len(year) == 4 and 0 < len(month) < 3 and 0 < len(day) < 3:
+                return year, month, day
+    else:
+        parts = date_str.split('-')
+        if len(parts) == 3:
+            year, month, day = parts
+            if len(year) == 4 and 0 < len(month) < 3 and 0 < len(day) < 3:
+                return year, month, day
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(date_str: str) -> date:
+    """Parse various date formats"""
+    # Most exports use 11/6/2024 or 2024-11-06, which only need a split
+    parts = _split_numeric_date(date_str)
+    if parts and all(part.isdigit() for part in parts):
+        try:
+            return date(*map(int, parts))
+        except ValueError:
+            pass  # Out of range, leave it to the fallbacks below
+
+    # The other supported layouts are built straight from their digits so a
+    # well-formed date never goes through strptime's failed attempts
+    match = _DATE_VALUE_RE.fullmatch(date_str)
+    if match:
+        if match.group('m1'):
+            year, month, day = match.group('y1', 'm1', 'd1')
+        elif match.group('y2'):
+            year, month, day = match.group('y2', 'm2', 'd2')
+        else:
+            year, month, day = match.group('y3'), _MONTHS.get(match.group('mon3').lower()), match.group('d3')
+        if month:
+            try:
+                return date(int(year), int(month), int(day))
+            except ValueError:
+                pass  # Out of range, leave it to the fallbacks below
+
+    # Try different formats
+    formats = [
+        '%m/%d/%Y',  # 11/6/2024
+        '%m-%d-%Y',  # 11-6-2024
+        '%Y-%m-%d',  # 2024-11-06
+        '%B %d %Y',  # November 6 2024
+        '%b %d %Y',  # Nov 6 2024
+    ]
+
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            continue
+
+    # If all else fails, try to extract numbers
+    nums = _DIGITS_RE.findall(date_str)
+    if len(nums) >= 3:
+        # Assume month/day/year or year-month-day
+        if int(nums[0]) > 12:  # Year first
+            return datetime(int(nums[0]), int(nums[1]), int(nums[2])).date()
+        else:  # Month first
+            year = int(nums[2]) if int(nums[2]) > 2000 else int(nums[2]) + 2000
+            return datetime(year, int(nums[0]), int(nums[1])).date()
+
+    raise ValueError(f'Could not parse date: {date_str}')
+
+
+@lru_cache(maxsize=1024)
+def _parse_time(time_str: str) -> time:
+    """Parse time string"""
+    time_str = time_str.strip().upper()
+
+    # Handle 12-hour format with AM/PM
+    match = _CLOCK_RE.match(time_str)
+    if match:
+        hour = int(match.group(1))
+        minute = int(match.group(2))
+        am_pm = match.group(3)
+
+        if am_pm:
+            if am_pm == 'PM' and hour != 12:
+                hour += 12
+            elif am_pm == 'AM' and hour == 12:
+                hour = 0
+
+        return time(hour, minute)
+
+    return time(12, 0)  # Default
+
+
+@lru_cache(maxsize=1024)
+def _parse_party_size(party_str: str) -> int:
+    """Extract party size from string"""
+    # Look each word up once instead of scanning the string for every number word.
+    # Letter runs, so '**Two**', '"two"' and 'Two-top' still match.
+    for word in _WORD_RE.findall(party_str.lower()):
+        num = _PARTY_WORDS.get(word)
+        if num:
+            return num
+
+    # Extract first number found
+    match = _DIGITS_RE.search(party_str)
+    if match:
+        return int(match.group())
+
+    return 1  # Default
+
+
 class ConfluenceMarkdownParser(BaseParser):
     """Parses Confluence markdown format content"""
 
     def can_parse(self, content: str) -> bool:
         """Check if content is in markdown format"""
-        # Markdown format contains tables with | characters and headings with #
-        return bool(re.search(r'\|.*\|', content) or re.search(r'#\s+', content))
+        # Markdown format contains tables with | characters and headings with #.
+        # The substring checks rule out most other content before any regex runs.
+        if '|' in content and _TABLE_ROW_RE.search(content):
+            return True
+        return '#' in content and bool(_HEADING_RE.search(content))
 
     def parse(self, page_id: str, content: str) -> Optional[ParsedReviewData]:
         """
@@ -35,11 +212,14 @@ class ConfluenceMarkdownParser(BaseParser):
         if not visit_info:
             return None
 
+        # Index the page into the text before the first dish heading and the dish sections
+        before_dishes_end, sections = self._split_sections(content)
+
         # Extract restaurant images (images before first dish heading)
-        restaurant_images = self.extract_restaurant_images(content, page_id)
+        restaurant_images = self._image_paths(content, page_id, 0, before_dishes_end)
 
         # Parse all dish reviews (including their images)
-        dishes = self.parse_dishes(content, page_id)
+        dishes = self._parse_sections(content, sections, page_id)
 
         # Calculate overall rating (average of all dish ratings)
         overall_rating = self.calculate_overall_rating(dishes)
@@ -60,19 +240,106 @@ class ConfluenceMarkdownParser(BaseParser):
             restaurant_images=restaurant_images,
         )
 
+    def _tokenize(self, content: str):
+        """
+        Yield a (kind, offset, line) triple for each line of the content.
+
+        Lines starting with '# **' at any heading level ('## **', ...;
+        whitespace allowed after the '#'s) are _LINE_DISH: they end the
+        previous dish section, whether or not they hold a well-formed dish
+        name. Everything else is _LINE_TEXT.
+        """
+        offset = 0
+        for line in content.split('\n'):
+            if _DISH_HEADING_RE.match(line):
+                yield _LINE_DISH, offset, line
+            else:
+                yield _LINE_TEXT, offset, line
+            offset += len(line) + 1
+
+    def _split_heading(self, line: str) -> Optional[Tuple[str, str]]:
+        """
+        Split a '# **Dish Name** ...' line (any heading level) into its name and the text after it.
+
+        Returns None when the name is empty or not closed by '**'.
+        """
+        name, _, rest = line[_DISH_HEADING_RE.match(line).end():].partition('*')
+        if not name or not rest.startswith('*'):
+            return None
+        return name.strip(), rest[1:]
+
+    def _split_sections(self, content: str) -> Tuple[int, List[Tuple[str, int, int]]]:
+        """
+        Index markdown content into dish sections in a single pass over its lines.
+
+        Sections are returned as offset ranges into the content rather than
+        copies, so the extractors can search them in place.
+
+        Args:
+            content: Full markdown content
+
+        Returns:
+            Tuple of (end offset of the text before the first dish heading,
+            list of (dish name, start offset, end offset) with surrounding whitespace excluded)
+        """
+        before_dishes_end = None
+        sections = []
+        section_name = None
+        section_start = None
+        section_blank = False
+
+        for kind, offset, line in self._tokenize(content):
+            if kind is _LINE_DISH:
+                # A heading on the very first line starts a dish but, having no
+                # newline before it, doesn't end the restaurant section
+                if offset and before_dishes_end is None:
+                    before_dishes_end = offset - 1
+                if section_start is not None and section_blank:
+                    # A dish with nothing but whitespace under it takes the
+                    # following heading line as the start of its content
+                    section_blank = False
+                    continue
+                if section_start is not None:
+                    sections.append(self._strip_section(content, section_name, section_start, offset - 1))
+                heading = self._split_heading(line)
+                if heading:
+                    section_name, heading_rest = heading
+                    section_start = offset + len(line) - len(heading_rest)
+                    section_blank = not heading_rest.strip()
+                else:
+                    # Malformed headings still end the previous dish
+                    section_start = None
+            elif section_blank:
+                section_blank = not line.strip()
+
+        if section_start is not None:
+            sections.append(self._strip_section(content, section_name, section_start, len(content)))
+
+        if before_dishes_end is None:
+            before_dishes_end = len(content)
+        return before_dishes_end, sections
+
+    def _strip_section(self, content: str, name: str, start: int, end: int) -> Tuple[str, int, int]:
+        """Narrow a (name, start, end) section so it excludes leading and trailing whitespace"""
+        while start < end and content[start].isspace():
+            start += 1
+        while end > start and content[end - 1].isspace():
+            end -= 1
+        return name, start, end
+
     def parse_visit_info(self, body_content: str) -> Optional[Dict]:
         """Extract visit information from the top table"""
         info = {}
 
         # Extract address
-        address_match = re.search(r'\|\s*Address\s*\|\s*([^\|]+)\s*\|', body_content, re.IGNORECASE)
+        address_match = _ADDRESS_RE.search(body_content)
         if address_match:
             info['address'] = address_match.group(1).strip()
             # Use address as location too
             info['location'] = address_match.group(1).strip()
 
         # Extract date (handle both plain text and Confluence date widget)
-        date_match = re.search(r'\|\s*Date\s*\|\s*(?:<custom[^>]*>)?([0-9]{1,2}[\/\-][0-9]{1,2}[\/\-][0-9]{2,4}|[A-Za-z]+\s+[0-9]{1,2}\s+[0-9]{4}|[0-9]{4}-[0-9]{2}-[0-9]{2})', body_content, re.IGNORECASE)
+        date_match = _DATE_RE.search(body_content)
         if date_match:
             date_str = date_match.group(1).strip()
             info['date'] = self.parse_date(date_str)
@@ -80,7 +347,7 @@ class ConfluenceMarkdownParser(BaseParser):
             return None  # Date is required
 
         # Extract time
-        time_match = re.search(r'\|\s*Time of Entry\s*\|\s*([0-9]{1,2}:[0-9]{2}\s*(?:AM|PM)?)', body_content, re.IGNORECASE)
+        time_match = _TIME_RE.search(body_content)
         if time_match:
             time_str = time_match.group(1).strip()
             info['time'] = self.parse_time(time_str)
@@ -88,7 +355,7 @@ class ConfluenceMarkdownParser(BaseParser):
             info['time'] = time(12, 0)  # Default to noon if not found
 
         # Extract party size
-        party_match = re.search(r'\|\s*Party\s*\|\s*([^\|]+)\s*\|', body_content, re.IGNORECASE)
+        party_match = _PARTY_RE.search(body_content)
         if party_match:
             party_str = party_match.group(1).strip()
             info['party_size'] = self.parse_party_size(party_str)
@@ -96,34 +363,29 @@ class ConfluenceMarkdownParser(BaseParser):
             info['party_size'] = 1  # Default to 1
 
         # Extract website (optional)
-        website_match = re.search(r'\|\s*Website\s*\|.*?https?://([^\s<\|]+)', body_content, re.IGNORECASE)
+        website_match = _WEBSITE_RE.search(body_content)
         if website_match:
             info['website'] = 'https://' + website_match.group(1)
 
         # Extract any notes before the first dish section
         # Look for text after the Order table but before the first dish heading
         # First, find everything after the Total row
-        total_match = re.search(r'\|\s*\*\*Total\*\*.*?\|\s*\n', body_content, re.DOTALL)
-        if total_match:
-            # Get content after the Total row
-            content_after_total = body_content[total_match.end():]
-
-            # Find the first dish heading (starts with # **)
-            first_dish_match = re.search(r'\n#\s*\*\*', content_after_total)
+        total_end = self._find_total_row_end(body_content)
+        if total_end != -1:
+            # Find the first dish heading (starts with # **) after the Total row
+            first_dish = self._find_dish_heading(body_content, total_end)
 
-            if first_dish_match:
+            if first_dish != -1:
                 # Extract text between Total and first dish heading
-                potential_notes = content_after_total[:first_dish_match.start()].strip()
+                potential_notes = body_content[total_end:first_dish].strip()
 
                 # Clean up formatting
-                potential_notes = re.sub(r'\u200c', '', potential_notes)  # Remove zero-width spaces
-                potential_notes = re.sub(r'<[^>]+>', '', potential_notes)  # Remove HTML tags
-                potential_notes = re.sub(r'!\[.*?\]\(.*?\)', '', potential_notes)  # Remove images
+                potential_notes = _NOTES_MARKUP_RE.sub('', potential_notes)  # Remove zero-width spaces, HTML tags and images
                 # Remove markdown table separators and fragments
-                potential_notes = re.sub(r'(?:[A-Z][a-z]{0,3}\s*)?\n(?:\|[^\n]*\|\s*\n)+', '', potential_notes)
-                potential_notes = re.sub(r'.*?---.*?\|.*?', '', potential_notes)
-                potential_notes = re.sub(r'\|\s*---.*', '', potential_notes)
-                potential_notes = re.sub(r'\n\s*\n\s*\n+', '\n\n', potential_notes)  # Clean excessive newlines
+                potential_notes = _TABLE_FRAGMENT_RE.sub('', potential_notes)
+                potential_notes = _SEPARATOR_FRAGMENT_RE.sub('', potential_notes)
+                potential_notes = _SEPARATOR_ROW_RE.sub('', potential_notes)
+                potential_notes = _EXCESS_NEWLINES_RE.sub('\n\n', potential_notes)  # Clean excessive newlines
                 potential_notes = potential_notes.strip()
 
                 # Only include if substantial and doesn't look like a heading
@@ -132,77 +394,65 @@ class ConfluenceMarkdownParser(BaseParser):
 
         return info if info.get('date') else None
 
-    def parse_date(self, date_str: str) -> datetime.date:
-        """Parse various date formats"""
-        # Try different formats
-        formats = [
-            '%m/%d/%Y',  # 11/6/2024
-            '%m-%d-%Y',  # 11-6-2024
-            '%Y-%m-%d',  # 2024-11-06
-            '%B %d %Y',  # November 6 2024
-            '%b %d %Y',  # Nov 6 2024
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt).date()
-            except ValueError:
-                continue
+    def _find_total_row_end(self, content: str) -> int:
+        """
+        Find where the '| **Total** ... |' row ends.
 
-        # If all else fails, try to extract numbers
-        nums = re.findall(r'\d+', date_str)
-        if len(nums) >= 3:
-            # Assume month/day/year or year-month-day
-            if int(nums[0]) > 12:  # Year first
-                return datetime(int(nums[0]), int(nums[1]), int(nums[2])).date()
-            else:  # Month first
-                year = int(nums[2]) if int(nums[2]) > 2000 else int(nums[2]) + 2000
-                return datetime(year, int(nums[0]), int(nums[1])).date()
+        Returns the offset just past the row's last newline (including any
+        blank lines straight after it), or -1 if there is no Total row.
+        """
+        start = content.find('**Total**')
+        while start != -1:
+            # The row starts with '|', optionally followed by whitespace
+            i = start - 1
+            while i >= 0 and content[i].isspace():
+                i -= 1
+            if i >= 0 and content[i] == '|':
+                break
+            start = content.find('**Total**', start + 1)
+        else:
+            return -1
+
+        # The row ends at the first later '|' with only whitespace before a newline
+        pipe = content.find('|', start + len('**Total**'))
+        while pipe != -1:
+            end = pipe + 1
+            while end < len(content) and content[end].isspace():
+                end += 1
+            newline = content.rfind('\n', pipe + 1, end)
+            if newline != -1:
+                return newline + 1
+            pipe = content.find('|', pipe + 1)
+        return -1
+
+    def _find_dish_heading(self, content: str, start: int = 0) -> int:
+        """Return the offset of the newline before the first '# **' heading (any level) at or after start, or -1"""
+        newline = content.find('\n#', start)
+        while newline != -1:
+            i = newline + 2
+            # '## **', '### **', ... are dish headings too
+            hashes = 1
+            while hashes < 6 and content.startswith('#', i):
+                hashes += 1
+                i += 1
+            while i < len(content) and content[i].isspace():
+                i += 1
+            if content.startswith('**', i):
+                return newline
+            newline = content.find('\n#', newline + 1)
+        return -1
 
-        raise ValueError(f'Could not parse date: {date_str}')
+    def parse_date(self, date_str: str) -> datetime.date:
+        """Parse various date formats"""
+        return _parse_date(date_str)
 
     def parse_time(self, time_str: str) -> time:
         """Parse time string"""
-        time_str = time_str.strip().upper()
-
-        # Handle 12-hour format with AM/PM
-        match = re.match(r'(\d{1,2}):(\d{2})\s*(AM|PM)?', time_str)
-        if match:
-            hour = int(match.group(1))
-            minute = int(match.group(2))
-            am_pm = match.group(3)
-
-            if am_pm:
-                if am_pm == 'PM' and hour != 12:
-                    hour += 12
-                elif am_pm == 'AM' and hour == 12:
-                    hour = 0
-
-            return time(hour, minute)
-
-        return time(12, 0)  # Default
+        return _parse_time(time_str)
 
     def parse_party_size(self, party_str: str) -> int:
         """Extract party size from string"""
-        # Handle "Self"
-        if 'self' in party_str.lower():
-            return 1
-
-        # Handle text numbers
-        text_numbers = {
-            'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-            'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10
-        }
-        for word, num in text_numbers.items():
-            if word in party_str.lower():
-                return num
-
-        # Extract first number found
-        match = re.search(r'\d+', party_str)
-        if match:
-            return int(match.group())
-
-        return 1  # Default
+        return _parse_party_size(party_str)
 
     def extract_restaurant_images(self, body_content: str, page_id: str) -> List[str]:
         """
@@ -216,39 +466,28 @@ class ConfluenceMarkdownParser(BaseParser):
         Returns:
             List of image paths relative to FoodTable/images/
         """
-        # Find first dish heading position
-        first_dish_match = re.search(r'\n#\s*\*\*', body_content)
-
-        if first_dish_match:
-            # Get content before first dish
-            before_dishes = body_content[:first_dish_match.start()]
-        else:
-            # No dishes found, check entire content
-            before_dishes = body_content
-
-        # Extract image markers
-        image_markers = re.findall(r'!\[IMAGE:([^\]]+)\]', before_dishes)
+        before_dishes_end, _ = self._split_sections(body_content)
+        return self._image_paths(body_content, page_id, 0, before_dishes_end)
 
-        # Convert to paths: reviews/{page_id}/{filename}
-        return [f'reviews/{page_id}/{filename}' for filename in image_markers]
+    def _image_paths(self, content: str, page_id: str, start: int, end: int) -> List[str]:
+        """Return reviews/{page_id}/{filename} paths for the image markers in content[start:end]"""
+        return [f'reviews/{page_id}/{filename}' for filename in _IMAGE_MARKER_RE.findall(content, start, end)]
 
     def parse_dishes(self, body_content: str, page_id: str) -> List[ParsedDish]:
         """Extract all dish reviews from the page"""
-        dishes = []
+        _, sections = self._split_sections(body_content)
+        return self._parse_sections(body_content, sections, page_id)
 
-        # Find all dish sections (starts with # **Dish Name**)
-        dish_pattern = r'#\s*\*\*([^*]+)\*\*\s*(.*?)(?=\n#\s*\*\*|\Z)'
-        dish_matches = re.finditer(dish_pattern, body_content, re.DOTALL)
-
-        for match in dish_matches:
-            dish_name = match.group(1).strip()
-            dish_content = match.group(2).strip()
+    def _parse_sections(self, content: str, sections: List[Tuple[str, int, int]], page_id: str) -> List[ParsedDish]:
+        """Build dishes from (dish name, start, end) sections of content, skipping those without ratings"""
+        dishes = []
 
+        for dish_name, start, end in sections:
             # Extract overall rating
-            rating_match = re.search(r'\*\*Overall Rating\s*-\s*(\d+)(?:/100)?\*\*', dish_content, re.IGNORECASE)
+            rating_match = _OVERALL_RATING_RE.search(content, start, end)
             if not rating_match:
                 # Try table format
-                rating_match = re.search(r'\|\s*\*\*Rating\*\*\s*\|\s*(\d+)\s*\|', dish_content)
+                rating_match = _TABLE_RATING_RE.search(content, start, end)
 
             if not rating_match:
                 continue  # Skip dishes without ratings
@@ -257,41 +496,36 @@ class ConfluenceMarkdownParser(BaseParser):
 
             # Extract cost
             cost = None
-            cost_match = re.search(r'\|\s*\*\*Cost\*\*\s*\|\s*\$?\s*([0-9.]+)\s*\|', dish_content)
+            cost_match = _COST_RE.search(content, start, end)
             if cost_match:
                 cost = Decimal(cost_match.group(1))
 
             # Extract images from dish content
-            dish_images = re.findall(r'!\[IMAGE:([^\]]+)\]', dish_content)
-            dish_image_paths = [f'reviews/{page_id}/{filename}' for filename in dish_images]
+            dish_image_paths = self._image_paths(content, page_id, start, end)
 
             # Extract detailed notes
             notes_parts = []
 
             # First, try to find free-form text BEFORE "Overall Rating"
             # This captures review text that appears between dish name and the rating
-            freeform_match = re.search(r'^(.*?)(?=\*\*Overall Rating)', dish_content, re.DOTALL)
+            freeform_match = _FREEFORM_RE.match(content, start, end)
 
             if freeform_match:
                 freeform_text = freeform_match.group(1).strip()
                 # Clean up the text
-                # Remove image markers (![IMAGE:filename])
-                freeform_text = re.sub(r'!\[IMAGE:[^\]]+\]', '', freeform_text)
-                # Remove other image references
-                freeform_text = re.sub(r'!\[.*?\]\(.*?\)', '', freeform_text)
+                # Remove image markers (![IMAGE:filename]) and other image references
+                freeform_text = _IMAGES_RE.sub('', freeform_text)
                 # Remove rating detail tables (contain Ra + table rows with Rating/Dish/Cost/Date)
                 # These unwanted tables appear after text content but before Overall Rating
-                freeform_text = re.sub(r'(?:[A-Z][a-z]{0,3}\s*)?\n(?:\|[^\n]*\|\s*\n)+', '', freeform_text)
+                freeform_text = _TABLE_FRAGMENT_RE.sub('', freeform_text)
                 # Remove zero-width space markers
-                freeform_text = re.sub(r'\u200c', '', freeform_text)
+                freeform_text = _ZWNJ_RE.sub('', freeform_text)
                 # Remove excessive newlines
-                freeform_text = re.sub(r'\n\s*\n\s*\n+', '\n\n', freeform_text)
+                freeform_text = _EXCESS_NEWLINES_RE.sub('\n\n', freeform_text)
                 freeform_text = freeform_text.strip()
 
                 # Check if this is actually structured content (has Texture/Taste/Presentation)
-                has_structured = bool(re.search(r'\*\*Texture\s*-', freeform_text) or
-                                     re.search(r'\*\*Taste\s*-', freeform_text) or
-                                     re.search(r'\*\*Presentation\s*-', freeform_text))
+                has_structured = bool(_STRUCTURED_RE.search(freeform_text))
 
                 if not has_structured and freeform_text and len(freeform_text) > 20:
                     # This is pure free-form review text
@@ -299,30 +533,33 @@ class ConfluenceMarkdownParser(BaseParser):
 
             # If no free-form text, parse structured sections (Texture/Taste/Presentation)
             if not notes_parts:
-                # Texture
-                texture_match = re.search(r'\*\*Texture\s*-\s*([0-9.]+/5)\*\*\s*\n\s*(.*?)(?=\n\*\*|\Z)', dish_content, re.DOTALL)
-                if texture_match:
-                    notes_parts.append(f"Texture ({texture_match.group(1)}): {texture_match.group(2).strip()}")
-
-                # Taste
-                taste_match = re.search(r'\*\*Taste\s*-\s*([0-9.]+/5)\*\*\s*\n\s*(.*?)(?=\n\*\*|\Z)', dish_content, re.DOTALL)
-                if taste_match:
-                    notes_parts.append(f"Taste ({taste_match.group(1)}): {taste_match.group(2).strip()}")
-
-                # Presentation
-                presentation_match = re.search(r'\*\*Presentation\s*-\s*([0-9.]+/5)\*\*\s*\n\s*(.*?)(?=\n\*\*|\Z)', dish_content, re.DOTALL)
-                if presentation_match:
-                    notes_parts.append(f"Presentation ({presentation_match.group(1)}): {presentation_match.group(2).strip()}")
+                # One scan picks up the first Texture, Taste and Presentation
+                # sections. Each search restarts just past the previous match
+                # rather than at its end, because a section body can run
+                # over a later heading that isn't at the start of a line.
+                found = {}
+                pos = start
+                while len(found) < len(_STRUCTURED_LABELS):
+                    section_match = _STRUCTURED_SECTION_RE.search(content, pos, end)
+                    if not section_match:
+                        break
+                    found.setdefault(section_match.group(1), section_match)
+                    pos = section_match.start() + 1
+
+                for label in _STRUCTURED_LABELS:
+                    if label in found:
+                        score, text = found[label].group(2, 3)
+                        notes_parts.append(f"{label} ({score}): {text.strip()}")
 
             notes = '\n\n'.join(notes_parts) if notes_parts else ''
 
             # Final cleanup: Remove any rating detail tables that made it through
             if notes:
-                notes = re.sub(r'(?:[A-Z][a-z]{0,3}\s*)?\n(?:\|[^\n]*\|\s*\n)+', '', notes)
+                notes = _TABLE_FRAGMENT_RE.sub('', notes)
                 # Remove any remaining markdown table separator rows and fragments
-                notes = re.sub(r'.*?---.*?\|.*?', '', notes)
-                notes = re.sub(r'\|\s*---.*', '', notes)
-                notes = re.sub(r'\n\s*\n\s*\n+', '\n\n', notes).strip()
+                notes = _SEPARATOR_FRAGMENT_RE.sub('', notes)
+                notes = _SEPARATOR_ROW_RE.sub('', notes)
+                notes = _EXCESS_NEWLINES_RE.sub('\n\n', notes).strip()
 
             dishes.append(ParsedDish(
                 name=dish_name,
@@ -340,5 +577,6 @@ class ConfluenceMarkdownParser(BaseParser):
             return 50  # Default neutral rating
 
         # Use average of all dish ratings
-        total = sum(dish.rating for dish in dishes)
-        return round(total / len(dishes))
+        ratings = [dish.rating for dish in dishes]
+        return round(sum(ratings) / len(ratings))
+
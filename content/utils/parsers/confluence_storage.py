@@ -2,22 +2,26 @@
 Parser for Confluence storage format (HTML/XML from REST API).
 """
 
-import re
 from typing import Optional
 from datetime import datetime, time, date
 from decimal import Decimal
 
 from .base import BaseParser, ParsedReviewData, ParsedDish
+from .confluence_markdown import ConfluenceMarkdownParser
 from content.utils.confluence_api import convert_confluence_storage_to_markdown
 
 
+# The markdown parser keeps no per-page state, so one instance serves every page
+_MARKDOWN_PARSER = ConfluenceMarkdownParser()
+
+
 class ConfluenceStorageParser(BaseParser):
     """Parses Confluence storage format (HTML/XML) content"""
 
     def can_parse(self, content: str) -> bool:
         """Check if content is in Confluence storage format"""
         # Storage format contains Confluence-specific XML tags
-        return bool(re.search(r'<ac:|<ri:|<table', content))
+        return '<ac:' in content or '<ri:' in content or '<table' in content
 
     def parse(self, page_id: str, content: str) -> Optional[ParsedReviewData]:
         """
@@ -34,11 +38,8 @@ class ConfluenceStorageParser(BaseParser):
         markdown_content = convert_confluence_storage_to_markdown(content)
 
         # Now use the same parsing logic as the markdown parser
-        # (We'll import and use it to avoid code duplication)
-        from .confluence_markdown import ConfluenceMarkdownParser
-
-        markdown_parser = ConfluenceMarkdownParser()
-        parsed_data = markdown_parser.parse(page_id, markdown_content)
+        # (to avoid code duplication)
+        parsed_data = _MARKDOWN_PARSER.parse(page_id, markdown_content)
 
         if parsed_data:
             parsed_data.confluence_page_id = page_id
@@ -1,77 +1,66 @@
-from .home import HomeView
-from .restaurant_list import RestaurantListView
-from .restaurant_detail import (
-    RestaurantDetailView,
-    RestaurantToggleVisitedView,
-    RestaurantDishCreateView,
-    RestaurantDishUpdateView,
-    RestaurantDishDeleteView,
-    RestaurantDishMarkTriedView,
-)
-from .restaurant_create import RestaurantCreateView
-from .restaurant_update import RestaurantUpdateView
-from .encyclopedia_list import EncyclopediaListView
-from .encyclopedia_detail import EncyclopediaDetailView
-from .encyclopedia_search import EncyclopediaSearchView
-from .restaurant_search_api import RestaurantSearchApiView
-from .encyclopedia_search_api import EncyclopediaSearchApiView
-from .encyclopedia_suggest_api import EncyclopediaSuggestApiView
-from .encyclopedia_create_api import EncyclopediaCreateApiView
-from .encyclopedia_parent_api import EncyclopediaParentApiView
-from .encyclopedia_quick_create_api import EncyclopediaQuickCreateApiView
-from .dish_link_api import DishLinkApiView
-from .dish_image_api import DishImageUploadApiView
-from .review_list import ReviewListView
-from .review_detail import ReviewDetailView
-from .review_dish_list import ReviewDishListView
-from .review_create_api import ReviewCreateApiView
-from .review_draft_api import ReviewDraftSaveApiView, ReviewDraftRetrieveApiView, ReviewDraftDeleteApiView
-from .recipe_list import RecipeListView
-from .recipe_detail import RecipeDetailView
-from .global_search import GlobalSearchView
-from .review_ai_rewrite_api import ReviewAIRewriteApiView
-from .encyclopedia_ai_prefill_api import EncyclopediaAIPrefillApiView
-from .encyclopedia_edit_api import EncyclopediaEditApiView
-from .wishlist_bulk import WishlistBulkCreateApiView
-from .wishlist_bulk_page import WishlistBulkPageView
-from .instagram_preview_api import InstagramPreviewApiView
+"""
+Views for the content app, one module per view (or small family of views).
 
-__all__ = [
-    'HomeView',
-    'RestaurantListView',
-    'RestaurantDetailView',
-    'RestaurantToggleVisitedView',
-    'RestaurantDishCreateView',
-    'RestaurantDishUpdateView',
-    'RestaurantDishDeleteView',
-    'RestaurantDishMarkTriedView',
-    'RestaurantCreateView',
-    'RestaurantUpdateView',
-    'EncyclopediaListView',
-    'EncyclopediaDetailView',
-    'EncyclopediaSearchView',
-    'RestaurantSearchApiView',
-    'EncyclopediaSearchApiView',
-    'EncyclopediaSuggestApiView',
-    'EncyclopediaCreateApiView',
-    'EncyclopediaParentApiView',
-    'EncyclopediaQuickCreateApiView',
-    'DishLinkApiView',
-    'DishImageUploadApiView',
-    'ReviewListView',
-    'ReviewDetailView',
-    'ReviewDishListView',
-    'ReviewCreateApiView',
-    'ReviewDraftSaveApiView',
-    'ReviewDraftRetrieveApiView',
-    'ReviewDraftDeleteApiView',
-    'RecipeListView',
-    'RecipeDetailView',
-    'GlobalSearchView',
-    'ReviewAIRewriteApiView',
-    'EncyclopediaAIPrefillApiView',
-    'EncyclopediaEditApiView',
-    'WishlistBulkCreateApiView',
-    'WishlistBulkPageView',
-    'InstagramPreviewApiView',
-]
+Each view class is imported from its module on first attribute access
+(PEP 562), so importing content.views for a single view does not load
+every view module and its dependencies.
+"""
+
+from importlib import import_module
+
+# View class name -> module that defines it
+_VIEW_MODULES = {
+    'HomeView': 'home',
+    'RestaurantListView': 'restaurant_list',
+    'RestaurantDetailView': 'restaurant_detail',
+    'RestaurantToggleVisitedView': 'restaurant_detail',
+    'RestaurantDishCreateView': 'restaurant_detail',
+    'RestaurantDishUpdateView': 'restaurant_detail',
+    'RestaurantDishDeleteView': 'restaurant_detail',
+    'RestaurantDishMarkTriedView': 'restaurant_detail',
+    'RestaurantCreateView': 'restaurant_create',
+    'RestaurantUpdateView': 'restaurant_update',
+    'EncyclopediaListView': 'encyclopedia_list',
+    'EncyclopediaDetailView': 'encyclopedia_detail',
+    'EncyclopediaSearchView': 'encyclopedia_search',
+    'RestaurantSearchApiView': 'restaurant_search_api',
+    'EncyclopediaSearchApiView': 'encyclopedia_search_api',
+    'EncyclopediaSuggestApiView': 'encyclopedia_suggest_api',
+    'EncyclopediaCreateApiView': 'encyclopedia_create_api',
+    'EncyclopediaParentApiView': 'encyclopedia_parent_api',
+    'EncyclopediaQuickCreateApiView': 'encyclopedia_quick_create_api',
+    'DishLinkApiView': 'dish_link_api',
+    'DishImageUploadApiView': 'dish_image_api',
+    'ReviewListView': 'review_list',
+    'ReviewDetailView': 'review_detail',
+    'ReviewDishListView': 'review_dish_list',
+    'ReviewCreateApiView': 'review_create_api',
+    'ReviewDraftSaveApiView': 'review_draft_api',
+    'ReviewDraftRetrieveApiView': 'review_draft_api',
+    'ReviewDraftDeleteApiView': 'review_draft_api',
+    'RecipeListView': 'recipe_list',
+    'RecipeDetailView': 'recipe_detail',
+    'GlobalSearchView': 'global_search',
+    'ReviewAIRewriteApiView': 'review_ai_rewrite_api',
+    'EncyclopediaAIPrefillApiView': 'encyclopedia_ai_prefill_api',
+    'EncyclopediaEditApiView': 'encyclopedia_edit_api',
+    'WishlistBulkCreateApiView': 'wishlist_bulk',
+    'WishlistBulkPageView': 'wishlist_bulk_page',
+    'InstagramPreviewApiView': 'instagram_preview_api',
+}
+
+__all__ = list(_VIEW_MODULES)
+
+
+def __getattr__(name):
+    module_name = _VIEW_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    view = getattr(import_module(f'.{module_name}', __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = view
+    return view
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
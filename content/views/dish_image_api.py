@@ -4,82 +4,158 @@ from django.utils.decorators import method_decorator
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.shortcuts import get_object_or_404
 from django.contrib.contenttypes.models import ContentType
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
 from content.models import ReviewDish, Image
 
 
+MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB in bytes
+
+# Leading bytes of each allowed image type; the client-supplied content type is not trusted
+IMAGE_SIGNATURES = {
+    'image/jpeg': (b'\xff\xd8\xff',),
+    'image/png': (b'\x89PNG\r\n\x1a\n',),
+    'image/gif': (b'GIF87a', b'GIF89a'),
+}
+
+
 def is_staff_user(user):
     """Check if user is staff."""
     return user.is_staff
 
 
+def sniff_image_type(image_file):
+    """Return the image content type from the file's leading bytes, or None if not allowed."""
+    image_file.seek(0)
+    header = image_file.read(12)
+    image_file.seek(0)
+
+    for content_type, signatures in IMAGE_SIGNATURES.items():
+        if header.startswith(signatures):
+            return content_type
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
+
+
+class MaxSizeUploadHandler(FileUploadHandler):
+    """
+    Upload handler that stops reading a file once it passes max_size.
+
+    Installed ahead of Django's memory/temporary-file handlers, so an
+    oversized upload is abandoned mid-stream instead of being buffered in
+    full before the view can reject it.
+    """
+
+    def __init__(self, request=None, max_size=MAX_IMAGE_SIZE):
+        super().__init__(request)
+        self.max_size = max_size
+        self.received = 0
+        self.too_large = False
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > self.max_size:
+            # The rest of the body is read and discarded so the client still gets the JSON error
+            self.too_large = True
+            raise StopUpload()
+        return raw_data
+
+    def file_complete(self, file_size):
+        # Let the following handlers build the uploaded file
+        return None
+
+
+@method_decorator(csrf_exempt, name='dispatch')
 @method_decorator([login_required, user_passes_test(is_staff_user)], name='dispatch')
 class DishImageUploadApiView(View):
     """
     API endpoint for uploading images to a ReviewDish.
     Requires authentication and staff permissions.
+
+    Upload handlers can only be changed before the request body is read, and
+    CsrfViewMiddleware reads it for POST requests, so CSRF is checked on post()
+    itself rather than by the middleware.
     """
 
+    def setup(self, request, *args, **kwargs):
+        self.size_limit = MaxSizeUploadHandler(request)
+        request.upload_handlers.insert(0, self.size_limit)
+        super().setup(request, *args, **kwargs)
+
+    @method_decorator(csrf_protect)
     def post(self, request, dish_id, *args, **kwargs):
         """
-        Upload an image to a dish.
+        Upload one or more images to a dish.
         POST body (multipart/form-data):
-            - image: image file (required)
+            - image: image file (required; repeat the field to upload several)
             - caption: optional caption
             - alt_text: optional alt text
-            - order: optional order (defaults to 0)
+            - order: optional order (defaults to 0, incremented per extra image)
         """
         try:
             # Get the dish
             dish = get_object_or_404(ReviewDish, id=dish_id)
 
-            # Get the uploaded file
-            image_file = request.FILES.get('image')
-            if not image_file:
-                return JsonResponse({'error': 'No image file provided'}, status=400)
+            # Get the uploaded files
+            image_files = request.FILES.getlist('image')
 
-            # Validate file type
-            allowed_types = ['image/jpeg', 'image/png', 'image/gif', 'image/webp']
-            if image_file.content_type not in allowed_types:
+            # Validate file size (10MB max); the upload is cut off as soon as it passes the limit
+            if self.size_limit.too_large:
                 return JsonResponse({
-                    'error': f'Invalid file type. Allowed types: JPEG, PNG, GIF, WebP'
+                    'error': f'File too large. Maximum size is 10MB'
                 }, status=400)
 
-            # Validate file size (10MB max)
-            max_size = 10 * 1024 * 1024  # 10MB in bytes
-            if image_file.size > max_size:
+            if not image_files:
+                return JsonResponse({'error': 'No image file provided'}, status=400)
+
+            # Validate file types from their contents
+            if any(sniff_image_type(image_file) is None for image_file in image_files):
                 return JsonResponse({
-                    'error': f'File too large. Maximum size is 10MB'
+                    'error': f'Invalid file type. Allowed types: JPEG, PNG, GIF, WebP'
                 }, status=400)
 
             # Get optional fields
             caption = request.POST.get('caption', '')
             alt_text = request.POST.get('alt_text', '')
-            order = request.POST.get('order', 0)
+            order = int(request.POST.get('order', 0))
 
-            # Create the Image instance
+            # Create the Image instances in a single INSERT
             content_type = ContentType.objects.get_for_model(ReviewDish)
-            image = Image.objects.create(
-                image=image_file,
-                caption=caption,
-                alt_text=alt_text,
-                order=order,
-                content_type=content_type,
-                object_id=dish.id,
-                uploaded_by=request.user
-            )
-
-            # Return success response with image data
+            images = Image.objects.bulk_create([
+                Image(
+                    image=image_file,
+                    caption=caption,
+                    alt_text=alt_text,
+                    order=order + index,
+                    content_type=content_type,
+                    object_id=dish.id,
+                    uploaded_by=request.user
+                )
+                for index, image_file in enumerate(image_files)
+            ])
+
+            # Return success response with image data ('image' is the first upload)
+            images_data = [self._image_data(image) for image in images]
             return JsonResponse({
                 'success': True,
-                'image': {
-                    'id': image.id,
-                    'url': image.image.url,
-                    'caption': image.caption,
-                    'alt_text': image.alt_text,
-                    'order': image.order,
-                    'uploaded_at': image.uploaded_at.isoformat(),
-                }
+                'image': images_data[0],
+                'images': images_data,
             })
 
         except Exception as e:
             return JsonResponse({'error': str(e)}, status=500)
+
+    def _image_data(self, image):
+        return {
+            'id': image.id,
+            'url': image.image.url,
+            'caption': image.caption,
+            'alt_text': image.alt_text,
+            'order': image.order,
+            'uploaded_at': image.uploaded_at.isoformat(),
+        }
@@ -1,9 +1,10 @@
-from django.http import JsonResponse
 from django.views import View
 from django.utils.decorators import method_decorator
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.shortcuts import get_object_or_404
 from content.models import ReviewDish, Encyclopedia
+from content.utils import json_api
+from content.utils.json_api import FastJsonResponse
 import json
 
 
@@ -26,11 +27,11 @@ class DishLinkApiView(View):
         """
         try:
             # Parse request body
-            data = json.loads(request.body)
+            data = json_api.loads(request.body)
             encyclopedia_id = data.get('encyclopedia_id')
 
             if not encyclopedia_id:
-                return JsonResponse({'error': 'encyclopedia_id is required'}, status=400)
+                return FastJsonResponse({'error': 'encyclopedia_id is required'}, status=400)
 
             # Get the dish and encyclopedia entry
             dish = get_object_or_404(ReviewDish, id=dish_id)
@@ -38,10 +39,10 @@ class DishLinkApiView(View):
 
             # Update the link
             dish.encyclopedia_entry = encyclopedia_entry
-            dish.save()
+            dish.save(update_fields=['encyclopedia_entry'])
 
             # Return updated dish info
-            return JsonResponse({
+            return FastJsonResponse({
                 'success': True,
                 'dish': {
                     'id': dish.id,
@@ -55,9 +56,9 @@ class DishLinkApiView(View):
             })
 
         except json.JSONDecodeError:
-            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+            return FastJsonResponse({'error': 'Invalid JSON'}, status=400)
         except Exception as e:
-            return JsonResponse({'error': str(e)}, status=500)
+            return FastJsonResponse({'error': str(e)}, status=500)
 
     def delete(self, request, dish_id, *args, **kwargs):
         """
@@ -66,9 +67,9 @@ class DishLinkApiView(View):
         try:
             dish = get_object_or_404(ReviewDish, id=dish_id)
             dish.encyclopedia_entry = None
-            dish.save()
+            dish.save(update_fields=['encyclopedia_entry'])
 
-            return JsonResponse({
+            return FastJsonResponse({
                 'success': True,
                 'dish': {
                     'id': dish.id,
@@ -77,4 +78,4 @@ class DishLinkApiView(View):
             })
 
         except Exception as e:
-            return JsonResponse({'error': str(e)}, status=500)
+            return FastJsonResponse({'error': str(e)}, status=500)
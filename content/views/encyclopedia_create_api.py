@@ -1,12 +1,13 @@
-from django.http import JsonResponse
 from django.views import View
 from django.utils.decorators import method_decorator
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.shortcuts import get_object_or_404
-from django.utils.text import slugify
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from content.models import ReviewDish, Encyclopedia
+from content.utils.encyclopedia import OPTIONAL_TEXT_FIELDS, unique_encyclopedia_slug
+from content.utils import json_api
+from content.utils.json_api import FastJsonResponse
 import json
 
 
@@ -42,7 +43,7 @@ class EncyclopediaCreateApiView(View):
         """
         try:
             # Parse request body
-            data = json.loads(request.body)
+            data = json_api.loads(request.body)
 
             # Extract required fields
             name = data.get('name', '').strip()
@@ -51,9 +52,9 @@ class EncyclopediaCreateApiView(View):
 
             # Validate required fields
             if not name:
-                return JsonResponse({'error': 'Name is required'}, status=400)
+                return FastJsonResponse({'error': 'Name is required'}, status=400)
             if not description:
-                return JsonResponse({'error': 'Description is required'}, status=400)
+                return FastJsonResponse({'error': 'Description is required'}, status=400)
 
             # Get the dish if dish_id provided
             dish = None
@@ -61,12 +62,10 @@ class EncyclopediaCreateApiView(View):
                 dish = get_object_or_404(ReviewDish, id=dish_id)
 
             # Extract optional fields
-            cuisine_type = data.get('cuisine_type', '').strip() or None
-            dish_category = data.get('dish_category', '').strip() or None
-            region = data.get('region', '').strip() or None
-            cultural_significance = data.get('cultural_significance', '').strip()
-            popular_examples = data.get('popular_examples', '').strip()
-            history = data.get('history', '').strip()
+            optional_fields = {}
+            for field, empty_as_none in OPTIONAL_TEXT_FIELDS:
+                value = data.get(field, '').strip()
+                optional_fields[field] = (value or None) if empty_as_none else value
             parent_id = data.get('parent_id')
             similar_dishes_ids = data.get('similar_dishes_ids', [])
 
@@ -76,57 +75,51 @@ class EncyclopediaCreateApiView(View):
                 try:
                     parent = Encyclopedia.objects.get(id=parent_id)
                 except Encyclopedia.DoesNotExist:
-                    return JsonResponse({'error': 'Invalid parent entry'}, status=400)
+                    return FastJsonResponse({'error': 'Invalid parent entry'}, status=400)
 
-            # Generate slug
-            base_slug = slugify(name)
-            slug = base_slug
-            counter = 1
+            # Check the similar dish IDs before anything is written
+            similar_dishes = []
+            if similar_dishes_ids:
+                similar_dishes = list(Encyclopedia.objects.filter(id__in=similar_dishes_ids))
+                if len(similar_dishes) != len(similar_dishes_ids):
+                    return FastJsonResponse({'error': 'One or more similar dish IDs are invalid'}, status=400)
 
-            # Handle duplicate slugs by appending a number
-            while Encyclopedia.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
+            # Generate slug, appending a number if it is already taken
+            slug = unique_encyclopedia_slug(name)
 
             # Create the encyclopedia entry
             encyclopedia_entry = Encyclopedia(
                 name=name,
                 slug=slug,
                 description=description,
-                cuisine_type=cuisine_type,
-                dish_category=dish_category,
-                region=region,
-                cultural_significance=cultural_significance,
-                popular_examples=popular_examples,
-                history=history,
                 parent=parent,
-                created_by=request.user
+                created_by=request.user,
+                **optional_fields
             )
 
-            # Validate and save
+            # Validate the entry's own fields. parent and created_by were just
+            # loaded and the slug was just checked, so skip re-querying them;
+            # the unique constraint still guards the slug on save.
             try:
-                encyclopedia_entry.full_clean()
-                encyclopedia_entry.save()
+                encyclopedia_entry.full_clean(exclude=['parent', 'created_by'], validate_unique=False)
             except ValidationError as e:
-                return JsonResponse({'error': str(e)}, status=400)
+                return FastJsonResponse({'error': str(e)}, status=400)
 
-            # Link similar dishes if provided
-            if similar_dishes_ids:
+            # Save the entry and its links together, so a failure leaves nothing behind
+            with transaction.atomic():
                 try:
-                    # Validate that all IDs exist
-                    similar_dishes = Encyclopedia.objects.filter(id__in=similar_dishes_ids)
-                    if similar_dishes.count() != len(similar_dishes_ids):
-                        return JsonResponse({'error': 'One or more similar dish IDs are invalid'}, status=400)
+                    encyclopedia_entry.save()
+                except ValidationError as e:
+                    return FastJsonResponse({'error': str(e)}, status=400)
 
-                    # Set the similar dishes
+                # Link similar dishes if provided
+                if similar_dishes:
                     encyclopedia_entry.similar_dishes.set(similar_dishes)
-                except Exception as e:
-                    return JsonResponse({'error': f'Error linking similar dishes: {str(e)}'}, status=400)
 
-            # Link the dish to the new encyclopedia entry if dish was provided
-            if dish:
-                dish.encyclopedia_entry = encyclopedia_entry
-                dish.save()
+                # Link the dish to the new encyclopedia entry if dish was provided
+                if dish:
+                    dish.encyclopedia_entry = encyclopedia_entry
+                    dish.save(update_fields=['encyclopedia_entry'])
 
             # Return success response
             response_data = {
@@ -145,11 +138,11 @@ class EncyclopediaCreateApiView(View):
                     'id': dish.id,
                 }
 
-            return JsonResponse(response_data)
+            return FastJsonResponse(response_data)
 
         except json.JSONDecodeError:
-            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+            return FastJsonResponse({'error': 'Invalid JSON'}, status=400)
         except IntegrityError as e:
-            return JsonResponse({'error': f'Database error: {str(e)}'}, status=500)
+            return FastJsonResponse({'error': f'Database error: {str(e)}'}, status=500)
         except Exception as e:
-            return JsonResponse({'error': str(e)}, status=500)
+            return FastJsonResponse({'error': str(e)}, status=500)
@@ -1,7 +1,8 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Prefetch
 from django.views.generic import DetailView
 from content.models import Encyclopedia
-from content.utils.encyclopedia import build_encyclopedia_tree
+from content.utils.encyclopedia import build_encyclopedia_tree, build_hierarchy_breadcrumbs
 
 
 class EncyclopediaDetailView(LoginRequiredMixin, DetailView):
@@ -21,18 +22,31 @@ class EncyclopediaDetailView(LoginRequiredMixin, DetailView):
         Note: We don't prefetch similar_dishes here because it's a symmetrical ManyToMany
         relationship, which would cause infinite recursion during prefetch.
         """
-        return Encyclopedia.objects.all()
+        return Encyclopedia.objects.prefetch_related(
+            # Children are only listed as links
+            Prefetch('children', queryset=Encyclopedia.objects.only('id', 'name', 'slug', 'parent').order_by('name')),
+            'images',
+            'encyclopedia_tags',
+        )
 
     def get_context_data(self, **kwargs):
         """Add additional context for ancestors, children, and related content."""
         context = super().get_context_data(**kwargs)
         entry = self.object
 
+        roots, _ = build_encyclopedia_tree()
+        context['entries'] = roots
+
         # Add breadcrumb navigation
-        context['ancestors'] = entry.get_ancestors()
+        context['ancestors'] = self._ancestors_from_tree(entry, roots)
 
-        # Add child entries
-        context['children'] = entry.children.all().order_by('name')
+        # The parent's own breadcrumb is the rest of the ancestor chain
+        context['parent_breadcrumb'] = ' > '.join(
+            ancestor.name for ancestor in reversed(context['ancestors'][1:])
+        )
+
+        # Add child entries (prefetched in name order)
+        context['children'] = entry.children.all()
 
         # Add images
         context['images'] = entry.images.all()
@@ -53,9 +67,45 @@ class EncyclopediaDetailView(LoginRequiredMixin, DetailView):
 
         # Add similar dishes with optimized query
         # Convert to list to prevent recursion issues with symmetrical ManyToMany relationship
-        context['similar_dishes'] = list(entry.similar_dishes.all().order_by('name'))
-
-        roots, _ = build_encyclopedia_tree()
-        context['entries'] = roots
+        # Only the columns the similar dish cards show; the long text fields stay in the database
+        context['similar_dishes'] = list(
+            entry.similar_dishes
+            .only(
+                'id', 'name', 'slug', 'description', 'is_placeholder',
+                'cuisine_type', 'dish_category', 'region', 'parent',
+            )
+            .order_by('name')
+        )
+        breadcrumbs = build_hierarchy_breadcrumbs(context['similar_dishes'])
+        for similar_dish in context['similar_dishes']:
+            similar_dish.hierarchy_breadcrumb = breadcrumbs[similar_dish.id]
 
         return context
+
+    def _ancestors_from_tree(self, entry, roots):
+        """
+        Return entry.get_ancestors() using the entries already loaded for the tree.
+
+        The sidebar tree already holds every visible entry, so the breadcrumb
+        needs no query of its own. Falls back to get_ancestors() if the chain
+        leaves the tree (e.g. through a cycle).
+        """
+        entries_by_id = {}
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            entries_by_id[node.id] = node
+            stack.extend(node.tree_children)
+
+        ancestors = []
+        visited = set()
+        parent_id = entry.parent_id
+        while parent_id is not None and parent_id not in visited:
+            parent = entries_by_id.get(parent_id)
+            if parent is None:
+                return entry.get_ancestors()
+            visited.add(parent_id)
+            ancestors.append(parent)
+            parent_id = parent.parent_id
+
+        return ancestors
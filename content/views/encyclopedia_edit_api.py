@@ -1,15 +1,17 @@
 import json
 import logging
 
-from django.http import JsonResponse
 from django.views import View
 from django.utils.decorators import method_decorator
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.shortcuts import get_object_or_404
-from django.utils.text import slugify
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError
 
 from content.models import Encyclopedia
+from content.utils import json_api
+from content.utils.encyclopedia import OPTIONAL_TEXT_FIELDS, unique_encyclopedia_slug
+from content.utils.json_api import FastJsonResponse
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +26,7 @@ class EncyclopediaEditApiView(View):
     def get(self, request, entry_id, *args, **kwargs):
         entry = get_object_or_404(Encyclopedia, id=entry_id)
 
-        return JsonResponse({
+        return FastJsonResponse({
             'success': True,
             'entry': {
                 'id': entry.id,
@@ -46,65 +48,58 @@ class EncyclopediaEditApiView(View):
 
     def patch(self, request, entry_id, *args, **kwargs):
         try:
-            data = json.loads(request.body) if request.body else {}
+            data = json_api.loads(request.body) if request.body else {}
         except json.JSONDecodeError:
-            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+            return FastJsonResponse({'error': 'Invalid JSON'}, status=400)
 
         entry = get_object_or_404(Encyclopedia, id=entry_id)
 
+        # Columns to write; the rest of the row is left untouched
+        changed = ['updated_at']
+
         if 'name' in data:
             new_name = data['name'].strip()
             if not new_name:
-                return JsonResponse({'error': 'Name cannot be empty'}, status=400)
+                return FastJsonResponse({'error': 'Name cannot be empty'}, status=400)
             if new_name != entry.name:
-                base_slug = slugify(new_name)
-                slug = base_slug
-                counter = 1
-                while Encyclopedia.objects.filter(slug=slug).exclude(pk=entry.pk).exists():
-                    slug = f"{base_slug}-{counter}"
-                    counter += 1
+                entry.slug = unique_encyclopedia_slug(new_name, exclude_pk=entry.pk)
                 entry.name = new_name
-                entry.slug = slug
+                changed += ['name', 'slug']
 
         if 'description' in data:
             entry.description = data['description'].strip()
+            changed.append('description')
             if entry.is_placeholder and entry.description:
                 entry.is_placeholder = False
+                changed.append('is_placeholder')
 
-        if 'cuisine_type' in data:
-            entry.cuisine_type = data['cuisine_type'].strip() or None
-
-        if 'dish_category' in data:
-            entry.dish_category = data['dish_category'].strip() or None
-
-        if 'region' in data:
-            entry.region = data['region'].strip() or None
-
-        if 'cultural_significance' in data:
-            entry.cultural_significance = data['cultural_significance'].strip()
-
-        if 'popular_examples' in data:
-            entry.popular_examples = data['popular_examples'].strip()
-
-        if 'history' in data:
-            entry.history = data['history'].strip()
+        for field, empty_as_none in OPTIONAL_TEXT_FIELDS:
+            if field in data:
+                value = data[field].strip()
+                setattr(entry, field, (value or None) if empty_as_none else value)
+                changed.append(field)
 
+        # The edit never changes parent or created_by, and the slug was just
+        # picked as unused, so full_clean() skips the queries re-checking them.
+        # A slug taken concurrently still fails on the unique constraint.
         try:
-            entry.full_clean()
-            entry.save()
+            entry.full_clean(exclude=['parent', 'created_by'], validate_unique=False)
+            entry.save(update_fields=changed)
         except ValidationError as e:
-            return JsonResponse({'error': str(e)}, status=400)
+            return FastJsonResponse({'error': str(e)}, status=400)
+        except IntegrityError as e:
+            return FastJsonResponse({'error': f'Database error: {str(e)}'}, status=400)
 
         if 'similar_dishes_ids' in data:
             ids = data['similar_dishes_ids']
             if not isinstance(ids, list):
-                return JsonResponse({'error': 'similar_dishes_ids must be a list'}, status=400)
+                return FastJsonResponse({'error': 'similar_dishes_ids must be a list'}, status=400)
             similar = Encyclopedia.objects.filter(id__in=ids)
             if similar.count() != len(ids):
-                return JsonResponse({'error': 'One or more similar dish IDs are invalid'}, status=400)
+                return FastJsonResponse({'error': 'One or more similar dish IDs are invalid'}, status=400)
             entry.similar_dishes.set(similar)
 
-        return JsonResponse({
+        return FastJsonResponse({
             'success': True,
             'encyclopedia': {
                 'id': entry.id,
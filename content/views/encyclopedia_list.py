@@ -1,9 +1,13 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from django.views.generic import ListView
 from content.models import Encyclopedia
-from content.utils.encyclopedia import build_encyclopedia_tree
+from content.utils.encyclopedia import build_encyclopedia_tree, encyclopedia_tree_etag
 
 
+# On get() rather than dispatch() so the login check runs first
+@method_decorator(condition(etag_func=encyclopedia_tree_etag), name='get')
 class EncyclopediaListView(LoginRequiredMixin, ListView):
     """
     Tree view for encyclopedia entries.
@@ -24,7 +28,7 @@ class EncyclopediaListView(LoginRequiredMixin, ListView):
 
         roots, max_depth = build_encyclopedia_tree()
         context['entries'] = roots
-        context['total_entries'] = Encyclopedia.objects.filter(is_placeholder=False).count()
+        context['total_entries'] = self._count_non_placeholders(roots)
         context['max_depth'] = max_depth + 1  # +1 because depth is 0-indexed
 
         if self.request.user.is_staff:
@@ -37,3 +41,19 @@ class EncyclopediaListView(LoginRequiredMixin, ListView):
             context['placeholder_count'] = context['placeholder_entries'].count()
 
         return context
+
+    def _count_non_placeholders(self, roots):
+        """
+        Count the non-placeholder entries in the tree.
+
+        Every non-placeholder entry is in the tree (only placeholder leaves
+        are pruned), so this matches a COUNT query without running one.
+        """
+        count = 0
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            if not node.is_placeholder:
+                count += 1
+            stack.extend(node.tree_children)
+        return count
@@ -1,10 +1,11 @@
-from django.http import JsonResponse
 from django.views import View
 from django.utils.decorators import method_decorator
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.shortcuts import get_object_or_404
 from django.core.exceptions import ValidationError
 from content.models import Encyclopedia
+from content.utils import json_api
+from content.utils.json_api import FastJsonResponse
 import json
 
 
@@ -27,7 +28,7 @@ class EncyclopediaParentApiView(View):
         """
         try:
             # Parse request body
-            data = json.loads(request.body)
+            data = json_api.loads(request.body)
             parent_id = data.get('parent_id')
 
             # Get the encyclopedia entry
@@ -44,12 +45,21 @@ class EncyclopediaParentApiView(View):
 
             # Save will trigger validation including cycle check
             try:
-                entry.save()
+                entry.save(update_fields=['parent', 'updated_at'])
             except ValidationError as e:
-                return JsonResponse({'error': str(e)}, status=400)
+                return FastJsonResponse({'error': str(e)}, status=400)
+
+            # Fetch the new parent chain once for both the ancestors list and the
+            # breadcrumb, reading only the columns the response needs
+            ancestor_ids = entry.get_ancestor_ids()
+            ancestors_by_id = {
+                ancestor['id']: ancestor
+                for ancestor in Encyclopedia.objects.filter(id__in=ancestor_ids).values('id', 'name', 'slug')
+            }
+            ancestors = [ancestors_by_id[ancestor_id] for ancestor_id in ancestor_ids]
 
             # Return updated entry info
-            return JsonResponse({
+            return FastJsonResponse({
                 'success': True,
                 'entry': {
                     'id': entry.id,
@@ -60,19 +70,12 @@ class EncyclopediaParentApiView(View):
                         'name': entry.parent.name,
                         'slug': entry.parent.slug,
                     } if entry.parent else None,
-                    'ancestors': [
-                        {
-                            'id': ancestor.id,
-                            'name': ancestor.name,
-                            'slug': ancestor.slug,
-                        }
-                        for ancestor in entry.get_ancestors()
-                    ],
-                    'hierarchy': entry.get_hierarchy_breadcrumb(),
+                    'ancestors': ancestors,
+                    'hierarchy': ' > '.join(ancestor['name'] for ancestor in reversed(ancestors)),
                 }
             })
 
         except json.JSONDecodeError:
-            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+            return FastJsonResponse({'error': 'Invalid JSON'}, status=400)
         except Exception as e:
-            return JsonResponse({'error': str(e)}, status=500)
+            return FastJsonResponse({'error': str(e)}, status=500)
@@ -1,11 +1,12 @@
-from django.http import JsonResponse
 from django.views import View
 from django.utils.decorators import method_decorator
 from django.contrib.auth.decorators import login_required, user_passes_test
-from django.utils.text import slugify
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from content.models import Encyclopedia
+from content.utils.encyclopedia import unique_encyclopedia_slug
+from content.utils import json_api
+from content.utils.json_api import FastJsonResponse
 import json
 
 
@@ -32,7 +33,7 @@ class EncyclopediaQuickCreateApiView(View):
         """
         try:
             # Parse request body
-            data = json.loads(request.body)
+            data = json_api.loads(request.body)
 
             # Extract fields
             name = data.get('name', '').strip()
@@ -41,23 +42,16 @@ class EncyclopediaQuickCreateApiView(View):
 
             # Validate required fields
             if not name:
-                return JsonResponse({'error': 'Name is required'}, status=400)
+                return FastJsonResponse({'error': 'Name is required'}, status=400)
 
             # Check for duplicate name
             if Encyclopedia.objects.filter(name__iexact=name).exists():
-                return JsonResponse({
+                return FastJsonResponse({
                     'error': f'An encyclopedia entry with the name "{name}" already exists'
                 }, status=400)
 
-            # Generate slug
-            base_slug = slugify(name)
-            slug = base_slug
-            counter = 1
-
-            # Handle duplicate slugs by appending a number
-            while Encyclopedia.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
+            # Generate slug, appending a number if it is already taken
+            slug = unique_encyclopedia_slug(name)
 
             # Create the placeholder encyclopedia entry
             encyclopedia_entry = Encyclopedia(
@@ -69,12 +63,13 @@ class EncyclopediaQuickCreateApiView(View):
                 created_by=request.user
             )
 
-            # Validate and save
+            # Validate and save. created_by is the request user and the slug was
+            # just checked, so full_clean() skips re-querying them.
             try:
-                encyclopedia_entry.full_clean()
+                encyclopedia_entry.full_clean(exclude=['created_by'], validate_unique=False)
                 encyclopedia_entry.save()
             except ValidationError as e:
-                return JsonResponse({'error': str(e)}, status=400)
+                return FastJsonResponse({'error': str(e)}, status=400)
 
             # Link to source entry as similar dish if provided
             if source_entry_id:
@@ -88,7 +83,7 @@ class EncyclopediaQuickCreateApiView(View):
                     pass
 
             # Return success response with minimal data for widget integration
-            return JsonResponse({
+            return FastJsonResponse({
                 'success': True,
                 'entry': {
                     'id': encyclopedia_entry.id,
@@ -99,8 +94,8 @@ class EncyclopediaQuickCreateApiView(View):
             })
 
         except json.JSONDecodeError:
-            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+            return FastJsonResponse({'error': 'Invalid JSON'}, status=400)
         except IntegrityError as e:
-            return JsonResponse({'error': f'Database error: {str(e)}'}, status=500)
+            return FastJsonResponse({'error': f'Database error: {str(e)}'}, status=500)
         except Exception as e:
-            return JsonResponse({'error': str(e)}, status=500)
+            return FastJsonResponse({'error': str(e)}, status=500)
@@ -26,15 +26,19 @@ class EncyclopediaSearchView(LoginRequiredMixin, ListView):
             # Return empty queryset for empty searches
             return Encyclopedia.objects.none()
 
-        # Create search query
-        search_query = SearchQuery(query)
+        # websearch syntax lets users write "phrases", OR and -excluded words
+        search_query = SearchQuery(query, search_type='websearch')
 
-        # Search using the search_vector field and rank results
+        # Search using the search_vector field (GIN indexed) and rank results.
+        # Only the columns the result cards show are loaded, and their first
+        # image comes from one prefetch instead of a query per card.
         queryset = Encyclopedia.objects.annotate(
             rank=SearchRank(F('search_vector'), search_query)
         ).filter(
             search_vector=search_query
-        ).order_by('-rank')
+        ).only(
+            'id', 'name', 'slug', 'description', 'cuisine_type', 'dish_category'
+        ).prefetch_related('images').order_by('-rank')
 
         return queryset
 
@@ -4,6 +4,7 @@ from django.views import View
 from django.contrib.postgres.search import SearchRank
 from django.db.models import F, Q
 from content.models import Encyclopedia
+from content.utils.encyclopedia import build_hierarchy_breadcrumbs
 from content.utils.search import build_prefix_search_query
 
 
@@ -19,39 +20,43 @@ class EncyclopediaSearchApiView(View):
         Search encyclopedia entries and return JSON response.
         Query parameter: q (search query)
 
-        Uses a multi-strategy approach:
+        Combines, in a single query:
         1. Full-text search with prefix matching (e.g., "chee:*" matches "cheese")
-        2. Fallback to case-insensitive ILIKE for partial matches
+        2. Case-insensitive ILIKE for partial matches
         """
         query = request.GET.get('q', '').strip()
 
         if not query:
             return JsonResponse({'results': []})
 
-        # Strategy 1: Try full-text search with prefix matching.
+        # Only the columns the results use (parent for the breadcrumbs)
+        candidates = Encyclopedia.objects.only(
+            'id', 'name', 'slug', 'parent', 'cuisine_type', 'dish_category'
+        )
+        partial_match = Q(name__icontains=query) | Q(description__icontains=query)
+
+        # Full-text prefix matches and icontains partial matches in one query, top 20
+        # by relevance. Partial-only matches rank 0, so they follow the
+        # full-text hits.
+        entries = None
         search_query = build_prefix_search_query(query)
         if search_query is not None:
             try:
-                entries = Encyclopedia.objects.annotate(
-                    rank=SearchRank(F('search_vector'), search_query)
-                ).filter(
-                    search_vector=search_query
-                ).select_related('parent')
-                has_results = entries.exists()
+                entries = list(
+                    candidates.annotate(
+                        rank=SearchRank(F('search_vector'), search_query)
+                    ).filter(
+                        Q(search_vector=search_query) | partial_match
+                    ).order_by('-rank', 'name')[:20]
+                )
             except ProgrammingError:
-                has_results = False
-        else:
-            has_results = False
+                entries = None
 
-        # Strategy 2: If no results, fallback to ILIKE partial matching
-        if not has_results:
-            entries = Encyclopedia.objects.filter(
-                Q(name__icontains=query) |
-                Q(description__icontains=query)
-            ).select_related('parent')
+        # Partial matching only, when the query has no usable full-text terms
+        if entries is None:
+            entries = list(candidates.filter(partial_match)[:20])
 
-        # Limit to top 20 results and order by relevance
-        entries = entries[:20]
+        breadcrumbs = build_hierarchy_breadcrumbs(entries)
 
         # Build results with hierarchy
         results = []
@@ -60,7 +65,7 @@ class EncyclopediaSearchApiView(View):
                 'id': entry.id,
                 'name': entry.name,
                 'slug': entry.slug,
-                'hierarchy': entry.get_hierarchy_breadcrumb(),
+                'hierarchy': breadcrumbs[entry.id],
                 'cuisine_type': entry.cuisine_type or '',
                 'dish_category': entry.dish_category or '',
             })
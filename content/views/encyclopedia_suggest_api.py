@@ -3,7 +3,13 @@ from django.views import View
 from django.utils.decorators import method_decorator
 from django.contrib.auth.decorators import login_required
 from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection, transaction
 from content.models import Encyclopedia
+from content.utils.encyclopedia import build_hierarchy_breadcrumbs
+
+
+# Minimum trigram similarity for a suggestion (0.25 catches more typos/variations)
+SIMILARITY_THRESHOLD = 0.25
 
 
 @method_decorator(login_required, name='dispatch')
@@ -27,15 +33,25 @@ class EncyclopediaSuggestApiView(View):
         if not dish_name:
             return JsonResponse({'suggestions': []})
 
-        # Use PostgreSQL's trigram similarity for fuzzy matching
-        # Filter by similarity threshold (0.25 catches more typos/variations)
+        # Use PostgreSQL's trigram similarity for fuzzy matching.
+        # The % operator (trigram_similar) finds candidates through the name
+        # trigram index; its threshold is set for this transaction only, so
+        # exact similarity is computed just for those candidates.
         # Order by similarity score (highest first)
-        suggestions = (
-            Encyclopedia.objects
-            .annotate(similarity=TrigramSimilarity('name', dish_name))
-            .filter(similarity__gt=0.25)
-            .order_by('-similarity')[:5]
-        )
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT set_config('pg_trgm.similarity_threshold', %s, true)",
+                    [str(SIMILARITY_THRESHOLD)]
+                )
+            suggestions = list(
+                Encyclopedia.objects
+                .filter(name__trigram_similar=dish_name)
+                .annotate(similarity=TrigramSimilarity('name', dish_name))
+                .filter(similarity__gt=SIMILARITY_THRESHOLD)
+                .order_by('-similarity')[:5]
+            )
+        breadcrumbs = build_hierarchy_breadcrumbs(suggestions)
 
         # Format the results
         results = [
@@ -44,7 +60,7 @@ class EncyclopediaSuggestApiView(View):
                 'name': entry.name,
                 'slug': entry.slug,
                 'description': entry.description[:100] if entry.description else '',
-                'hierarchy': entry.get_hierarchy_breadcrumb(),
+                'hierarchy': breadcrumbs[entry.id],
                 'similarity': round(entry.similarity, 2)
             }
             for entry in suggestions
@@ -1,9 +1,8 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import ListView
 from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.db.models import F, Value, CharField, Q
-from itertools import chain
-from operator import attrgetter
+from django.db import connection
+from django.db.models import F, Value, CharField, QuerySet
 from content.models import Encyclopedia, Recipe, Review, Restaurant
 
 
@@ -21,6 +20,10 @@ class GlobalSearchView(LoginRequiredMixin, ListView):
         """
         Search across all content types and combine results.
         Returns results ranked by relevance, optionally filtered by type.
+
+        The ranked (id, content_type, rank) rows of every type are combined
+        with UNION ALL, so ordering and pagination happen in the database and
+        only the current page is loaded as model instances (see paginate_queryset).
         """
         query = self.request.GET.get('q', '').strip()
         content_type = self.request.GET.get('type', '').strip().lower()
@@ -29,61 +32,106 @@ class GlobalSearchView(LoginRequiredMixin, ListView):
             # Return empty list for empty searches
             return []
 
-        # Create search query
-        search_query = SearchQuery(query)
+        # websearch syntax lets users write "phrases", OR and -excluded words
+        search_query = SearchQuery(query, search_type='websearch')
 
-        results = []
+        branches = []
 
         # Search Encyclopedia (if not filtered or filtered to encyclopedia)
         if not content_type or content_type == 'encyclopedia':
-            encyclopedia_results = Encyclopedia.objects.annotate(
-                rank=SearchRank(F('search_vector'), search_query),
-                content_type=Value('encyclopedia', output_field=CharField())
-            ).filter(
-                search_vector=search_query
-            ).order_by('-rank')
-            results.extend(list(encyclopedia_results))
+            branches.append(self._ranked(Encyclopedia.objects.all(), 'encyclopedia', search_query))
 
         # Search Recipe (if not filtered or filtered to recipe)
         if not content_type or content_type == 'recipe':
-            recipe_results = Recipe.objects.filter(
-                is_private=False
-            ).annotate(
-                rank=SearchRank(F('search_vector'), search_query),
-                content_type=Value('recipe', output_field=CharField())
-            ).filter(
-                search_vector=search_query
-            ).order_by('-rank')
-            results.extend(list(recipe_results))
+            branches.append(self._ranked(Recipe.objects.filter(is_private=False), 'recipe', search_query))
 
         # Search Review (if not filtered or filtered to review)
         if not content_type or content_type == 'review':
-            review_results = Review.objects.filter(
-                is_private=False
-            ).annotate(
-                rank=SearchRank(F('search_vector'), search_query),
-                content_type=Value('review', output_field=CharField())
-            ).filter(
-                search_vector=search_query
-            ).prefetch_related(
-                'images',
-                'review_dishes__images'
-            ).order_by('-rank')
-            results.extend(list(review_results))
+            branches.append(self._ranked(Review.objects.filter(is_private=False), 'review', search_query))
 
         # Search Restaurant (if not filtered or filtered to restaurant)
         if not content_type or content_type == 'restaurant':
-            restaurant_results = Restaurant.objects.annotate(
-                rank=SearchRank(F('search_vector'), search_query),
-                content_type=Value('restaurant', output_field=CharField())
-            ).filter(
-                search_vector=search_query
-            ).order_by('-rank')
-            results.extend(list(restaurant_results))
+            branches.append(self._ranked(Restaurant.objects.all(), 'restaurant', search_query))
+
+        if not branches:
+            return []
+
+        results = branches[0]
+        if len(branches) > 1:
+            results = results.union(*branches[1:], all=True)
+
+        # Sort combined results by rank (descending); ties break on type and id so pages are stable
+        return results.order_by('-rank', 'content_type', 'id')
+
+    def _ranked(self, queryset, content_type, search_query):
+        """Return the matching (id, content_type, rank) rows of one content type."""
+        return queryset.annotate(
+            content_type=Value(content_type, output_field=CharField()),
+            rank=SearchRank(F('search_vector'), search_query),
+        ).filter(
+            search_vector=search_query
+        ).values('id', 'content_type', 'rank')
 
-        # Sort combined results by rank (descending)
-        results.sort(key=attrgetter('rank'), reverse=True)
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Count the results of each type; their sum is the paginator's total, so it runs no COUNT of its own."""
+        paginator = super().get_paginator(
+            queryset, per_page, orphans=orphans, allow_empty_first_page=allow_empty_first_page, **kwargs
+        )
+        self.type_counts = self._count_by_type(queryset) if isinstance(queryset, QuerySet) else {}
+        paginator.count = sum(self.type_counts.values())
+        return paginator
 
+    def _count_by_type(self, queryset):
+        """Return {content_type: number of matches} for the combined results in one grouped query."""
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT content_type, COUNT(*) FROM ({sql}) AS results GROUP BY content_type',
+                params
+            )
+            return dict(cursor.fetchall())
+
+    def paginate_queryset(self, queryset, page_size):
+        """Paginate the ranked rows, then load the page's objects with one query per type."""
+        paginator, page, object_list, is_paginated = super().paginate_queryset(queryset, page_size)
+        page.object_list = self._load_results(object_list)
+        return paginator, page, page.object_list, is_paginated
+
+    def _result_querysets(self):
+        """Querysets used to load a page of results, by content type."""
+        return {
+            'encyclopedia': Encyclopedia.objects.prefetch_related('images'),
+            'recipe': Recipe.objects.prefetch_related('images'),
+            'review': Review.objects.select_related('restaurant').prefetch_related(
+                'images',
+                'review_dishes__images'
+            ),
+            'restaurant': Restaurant.objects.all(),
+        }
+
+    def _load_results(self, rows):
+        """Turn ranked rows into model instances carrying content_type and rank, keeping their order."""
+        rows = list(rows)
+
+        ids_by_type = {}
+        for row in rows:
+            ids_by_type.setdefault(row['content_type'], []).append(row['id'])
+
+        querysets = self._result_querysets()
+        objects_by_type = {
+            content_type: querysets[content_type].in_bulk(ids)
+            for content_type, ids in ids_by_type.items()
+        }
+
+        results = []
+        for row in rows:
+            obj = objects_by_type[row['content_type']].get(row['id'])
+            if obj is None:
+                # Deleted between the search and the page load
+                continue
+            obj.content_type = row['content_type']
+            obj.rank = row['rank']
+            results.append(obj)
         return results
 
     def get_context_data(self, **kwargs):
@@ -92,16 +140,11 @@ class GlobalSearchView(LoginRequiredMixin, ListView):
         context['query'] = self.request.GET.get('q', '')
         context['filter_type'] = self.request.GET.get('type', '')
 
-        # Count results by type
-        if context['results']:
-            context['encyclopedia_count'] = sum(1 for r in context['results'] if r.content_type == 'encyclopedia')
-            context['recipe_count'] = sum(1 for r in context['results'] if r.content_type == 'recipe')
-            context['review_count'] = sum(1 for r in context['results'] if r.content_type == 'review')
-            context['restaurant_count'] = sum(1 for r in context['results'] if r.content_type == 'restaurant')
-        else:
-            context['encyclopedia_count'] = 0
-            context['recipe_count'] = 0
-            context['review_count'] = 0
-            context['restaurant_count'] = 0
+        # Count results by type across all pages, not just the current one
+        type_counts = getattr(self, 'type_counts', {})
+        context['encyclopedia_count'] = type_counts.get('encyclopedia', 0)
+        context['recipe_count'] = type_counts.get('recipe', 0)
+        context['review_count'] = type_counts.get('review', 0)
+        context['restaurant_count'] = type_counts.get('restaurant', 0)
 
         return context
@@ -1,8 +1,15 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.cache import cache
+from django.db import connection
 from django.views.generic import TemplateView
 from content.models import Review, Encyclopedia, Recipe
 
 
+# The home page stats are approximate; counting every table on each load isn't needed
+HOME_STATS_CACHE_KEY = 'home:stats'
+HOME_STATS_TIMEOUT = 300  # seconds
+
+
 class HomeView(LoginRequiredMixin, TemplateView):
     """
     Home page view displaying recent reviews, quick links, and stats.
@@ -26,11 +33,22 @@ class HomeView(LoginRequiredMixin, TemplateView):
             'review_dishes__images'
         ).order_by('-visit_date', '-entry_time')[:10]
 
-        # Calculate stats
-        context['stats'] = {
-            'encyclopedia_count': Encyclopedia.objects.count(),
-            'review_count': Review.objects.filter(is_private=False).count(),
-            'recipe_count': Recipe.objects.count(),
-        }
+        # Calculate stats (cached for a few minutes)
+        context['stats'] = cache.get_or_set(HOME_STATS_CACHE_KEY, self.get_stats, HOME_STATS_TIMEOUT)
 
         return context
+
+    def get_stats(self):
+        """Count the encyclopedia entries, public reviews and recipes in one query."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT (SELECT COUNT(*) FROM {Encyclopedia._meta.db_table}), '
+                f'(SELECT COUNT(*) FROM {Review._meta.db_table} WHERE NOT is_private), '
+                f'(SELECT COUNT(*) FROM {Recipe._meta.db_table})'
+            )
+            encyclopedia_count, review_count, recipe_count = cursor.fetchone()
+        return {
+            'encyclopedia_count': encyclopedia_count,
+            'review_count': review_count,
+            'recipe_count': recipe_count,
+        }
@@ -1,6 +1,7 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import ListView
-from content.models import Recipe
+from django.db.models import Prefetch
+from content.models import Recipe, Image
 
 
 class RecipeListView(LoginRequiredMixin, ListView):
@@ -16,14 +17,16 @@ class RecipeListView(LoginRequiredMixin, ListView):
     def get_queryset(self):
         """
         Return all public recipes ordered by name.
-        Optimizes queries with select_related and prefetch_related.
+        Loads only the columns the recipe cards display, with their images prefetched.
         """
         return Recipe.objects.filter(
             is_private=False
-        ).select_related(
-            'created_by',
-            'encyclopedia_entry'
+        ).only(
+            'id', 'name', 'slug', 'description', 'difficulty', 'servings',
+            'prep_time_minutes', 'cook_time_minutes', 'total_time_minutes'
         ).prefetch_related(
-            'images',
-            'recipe_tags'
+            Prefetch(
+                'images',
+                queryset=Image.objects.only('id', 'image', 'order', 'uploaded_at', 'content_type', 'object_id')
+            )
         ).order_by('name')
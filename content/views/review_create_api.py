@@ -58,12 +58,8 @@ class ReviewCreateApiView(LoginRequiredMixin, View):
                 # Create the review
                 review = self._create_review(data, request.user)
 
-                # Save review-level images
-                review_images_data = data.get('rating', {}).get('images', [])
-                image_errors = self._save_review_images(review, review_images_data, request.user)
-
-                # Create review dishes
-                image_errors.extend(self._create_dishes(review, data.get('dishes', []), request.user))
+                # Create review dishes (their photos are saved after the commit)
+                dish_images = self._create_dishes(review, data.get('dishes', []))
 
                 # Delete draft if provided
                 draft_id = data.get('draft_id')
@@ -74,6 +70,18 @@ class ReviewCreateApiView(LoginRequiredMixin, View):
                     except ReviewDraft.DoesNotExist:
                         pass  # Draft already deleted or doesn't exist
 
+            # Photos are decoded and written to storage after the commit, so the
+            # transaction isn't held open during file IO and a rolled-back review
+            # leaves no orphaned files; a failed photo is only a warning anyway
+            review_images_data = data.get('rating', {}).get('images', [])
+            image_errors = self._save_review_images(review, review_images_data, request.user)
+
+            dish_content_type = ContentType.objects.get_for_model(ReviewDish)
+            for review_dish, image_data in dish_images:
+                error = self._save_dish_image(review_dish, image_data, request.user, dish_content_type)
+                if error:
+                    image_errors.append(error)
+
             # Return success response (with warnings if any images failed)
             response = {
                 'success': True,
@@ -194,6 +202,7 @@ class ReviewCreateApiView(LoginRequiredMixin, View):
     def _save_review_images(self, review, images_data, user):
         """Save base64-encoded images attached to the review itself. Returns list of error strings."""
         errors = []
+        content_type = ContentType.objects.get_for_model(Review)
         for image_data in images_data:
             if not (isinstance(image_data, str) and image_data.startswith('data:image/')):
                 continue
@@ -206,7 +215,6 @@ class ReviewCreateApiView(LoginRequiredMixin, View):
                     name=f'review_{uuid.uuid4()}.{ext}'
                 )
 
-                content_type = ContentType.objects.get_for_model(Review)
                 Image.objects.create(
                     image=image_file,
                     content_type=content_type,
@@ -218,19 +226,23 @@ class ReviewCreateApiView(LoginRequiredMixin, View):
                 errors.append(f"A review photo failed to save: {e}")
         return errors
 
-    def _create_dishes(self, review, dishes_data, user):
-        """Create ReviewDish instances with images. Returns list of image save errors."""
-        image_errors = []
-        for dish_data in dishes_data:
-            encyclopedia_entry = None
-            encyclopedia_ids = dish_data.get('encyclopedia_ids', [])
+    def _create_dishes(self, review, dishes_data):
+        """
+        Create ReviewDish instances.
+
+        Returns a list of (review_dish, image_data) pairs for the dish photos
+        still to be saved.
+        """
+        dish_images = []
+
+        # Fetch every linked encyclopedia entry in one query
+        entry_ids = [self._encyclopedia_entry_id(dish_data) for dish_data in dishes_data]
+        entries = Encyclopedia.objects.in_bulk([entry_id for entry_id in entry_ids if entry_id is not None])
 
-            if encyclopedia_ids:
-                try:
-                    entry_id = int(encyclopedia_ids[0]['id'])
-                    encyclopedia_entry = Encyclopedia.objects.get(id=entry_id)
-                except (Encyclopedia.DoesNotExist, ValueError, KeyError, IndexError) as e:
-                    logger.warning("Failed to link encyclopedia entry: %s", e)
+        for dish_data, entry_id in zip(dishes_data, entry_ids):
+            encyclopedia_entry = entries.get(entry_id)
+            if entry_id is not None and encyclopedia_entry is None:
+                logger.warning("Failed to link encyclopedia entry: entry %s does not exist", entry_id)
 
             cost = dish_data.get('cost')
             review_dish = ReviewDish.objects.create(
@@ -266,14 +278,27 @@ class ReviewCreateApiView(LoginRequiredMixin, View):
 
             image_data = dish_data.get('image')
             if image_data and image_data.startswith('data:image/'):
-                error = self._save_dish_image(review_dish, image_data, user)
-                if error:
-                    image_errors.append(error)
+                dish_images.append((review_dish, image_data))
 
-        return image_errors
+        return dish_images
 
-    def _save_dish_image(self, review_dish, image_data, user):
-        """Convert base64 image to Image model and attach to dish. Returns error string or None."""
+    def _encyclopedia_entry_id(self, dish_data):
+        """Return the id of the dish's first linked encyclopedia entry, or None."""
+        encyclopedia_ids = dish_data.get('encyclopedia_ids', [])
+        if not encyclopedia_ids:
+            return None
+        try:
+            return int(encyclopedia_ids[0]['id'])
+        except (ValueError, KeyError, IndexError) as e:
+            logger.warning("Failed to link encyclopedia entry: %s", e)
+            return None
+
+    def _save_dish_image(self, review_dish, image_data, user, content_type):
+        """
+        Convert base64 image to Image model and attach to dish. Returns error string or None.
+
+        content_type is the ReviewDish ContentType, looked up once by the caller.
+        """
         try:
             format_type, imgstr = image_data.split(';base64,')
             ext = format_type.split('/')[-1]  # jpeg, png, webp
@@ -283,7 +308,6 @@ class ReviewCreateApiView(LoginRequiredMixin, View):
                 name=f'dish_{uuid.uuid4()}.{ext}'
             )
 
-            content_type = ContentType.objects.get_for_model(ReviewDish)
             Image.objects.create(
                 image=image_file,
                 content_type=content_type,
@@ -1,6 +1,11 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import DetailView
-from content.models import Review
+from django.db.models import Prefetch
+from content.models import Review, ReviewDish, Image
+
+
+# Image columns used by the review card (ordering fields included)
+CARD_IMAGE_FIELDS = ('id', 'image', 'caption', 'order', 'uploaded_at', 'content_type', 'object_id')
 
 
 class ReviewDetailView(LoginRequiredMixin, DetailView):
@@ -36,9 +41,17 @@ class ReviewDetailView(LoginRequiredMixin, DetailView):
             is_private=False
         ).exclude(
             id=review.id
+        ).select_related(
+            'restaurant'
         ).prefetch_related(
-            'images',
-            'review_dishes__images'
+            # Only what the review cards read: image urls/captions and dish ratings
+            Prefetch('images', queryset=Image.objects.only(*CARD_IMAGE_FIELDS)),
+            Prefetch(
+                'review_dishes',
+                queryset=ReviewDish.objects.only('id', 'review', 'dish_rating').prefetch_related(
+                    Prefetch('images', queryset=Image.objects.only(*CARD_IMAGE_FIELDS))
+                )
+            )
         ).order_by('-visit_date', '-entry_time')[:5]
 
         return context
@@ -241,20 +241,27 @@ class ReviewDishListView(LoginRequiredMixin, ListView):
         queryset = ReviewDish.objects.filter(
             review__is_private=False
         ).select_related(
-            'review',  # Parent review
-            'encyclopedia_entry',  # Encyclopedia link (if present)
-            'review__created_by'  # Review author
-        ).prefetch_related(
-            'images'  # Dish images
+            'review__restaurant',  # Parent review and its restaurant
+            'encyclopedia_entry'  # Encyclopedia link (if present)
+        ).only(
+            # Just the columns the dish table displays
+            'id', 'dish_name', 'dish_rating', 'cost', 'review', 'encyclopedia_entry',
+            'review__id', 'review__visit_date', 'review__restaurant',
+            'review__restaurant__id', 'review__restaurant__name',
+            'encyclopedia_entry__id', 'encyclopedia_entry__name'
         )
 
-        # Apply filters from cleaned_data (automatically validated)
+        # Apply filters from cleaned_data (automatically validated).
+        # Every filter goes through this list, so is_filtered always knows
+        # whether the list is narrowed (all lookups follow single-valued
+        # relations, so one filter() call matches chained ones)
         cleaned_data = getattr(self.filter_form, 'cleaned_data', {})
+        filters = []
 
         # Dish search filter - searches dish names and encyclopedia entries
         if cleaned_data.get('search'):
             search_term = cleaned_data['search']
-            queryset = queryset.filter(
+            filters.append(
                 Q(dish_name__icontains=search_term) |
                 Q(encyclopedia_entry__name__icontains=search_term)
             )
@@ -262,38 +269,40 @@ class ReviewDishListView(LoginRequiredMixin, ListView):
         # Restaurant search filter - searches restaurant names
         if cleaned_data.get('restaurant_search'):
             restaurant_term = cleaned_data['restaurant_search']
-            queryset = queryset.filter(
-                review__restaurant__name__icontains=restaurant_term
-            )
+            filters.append(Q(review__restaurant__name__icontains=restaurant_term))
 
         # Link status filter
         link_status = cleaned_data.get('link_status')
         if link_status == 'linked':
-            queryset = queryset.filter(encyclopedia_entry__isnull=False)
+            filters.append(Q(encyclopedia_entry__isnull=False))
         elif link_status == 'unlinked':
-            queryset = queryset.filter(encyclopedia_entry__isnull=True)
+            filters.append(Q(encyclopedia_entry__isnull=True))
         # 'all' means no filter
 
         # Dish rating range filters (validated by form)
         if cleaned_data.get('rating_min') is not None:
-            queryset = queryset.filter(dish_rating__gte=cleaned_data['rating_min'])
+            filters.append(Q(dish_rating__gte=cleaned_data['rating_min']))
 
         if cleaned_data.get('rating_max') is not None:
-            queryset = queryset.filter(dish_rating__lte=cleaned_data['rating_max'])
+            filters.append(Q(dish_rating__lte=cleaned_data['rating_max']))
 
         # Cost range filters (validated by form)
         if cleaned_data.get('cost_min') is not None:
-            queryset = queryset.filter(cost__gte=cleaned_data['cost_min'])
+            filters.append(Q(cost__gte=cleaned_data['cost_min']))
 
         if cleaned_data.get('cost_max') is not None:
-            queryset = queryset.filter(cost__lte=cleaned_data['cost_max'])
+            filters.append(Q(cost__lte=cleaned_data['cost_max']))
 
         # Date range filters (validated by form) - filter by review visit date
         if cleaned_data.get('date_from'):
-            queryset = queryset.filter(review__visit_date__gte=cleaned_data['date_from'])
+            filters.append(Q(review__visit_date__gte=cleaned_data['date_from']))
 
         if cleaned_data.get('date_to'):
-            queryset = queryset.filter(review__visit_date__lte=cleaned_data['date_to'])
+            filters.append(Q(review__visit_date__lte=cleaned_data['date_to']))
+
+        self.is_filtered = bool(filters)
+        if filters:
+            queryset = queryset.filter(*filters)
 
         # Apply sorting
         has_search = bool(cleaned_data.get('search'))
@@ -354,7 +363,10 @@ class ReviewDishListView(LoginRequiredMixin, ListView):
         # Add active filters for badge display
         context['active_filters'] = self._get_active_filters()
 
-        # Add total count for "Showing X of Y" indicator
-        context['total_dishes'] = ReviewDish.objects.filter(review__is_private=False).count()
+        # Add total count for "Showing X of Y" indicator; unfiltered, that's the paginator's count
+        if self.is_filtered:
+            context['total_dishes'] = ReviewDish.objects.filter(review__is_private=False).count()
+        else:
+            context['total_dishes'] = context['paginator'].count
 
         return context
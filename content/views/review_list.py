@@ -2,7 +2,7 @@ from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import ListView
 from django.http import QueryDict
-from django.db.models import Count, F
+from django.db.models import Count, F, Value, CharField
 from django.contrib.postgres.search import SearchQuery, SearchRank
 from content.models import Restaurant, Review, ReviewTag
 from content.forms import ReviewFilterForm
@@ -26,9 +26,10 @@ class ReviewListView(LoginRequiredMixin, ListView):
         Returns:
             ReviewFilterForm: Validated form instance
         """
-        # Get dynamic choices
-        restaurant_choices = [(r, r) for r in self._get_restaurant_options()]
-        tag_choices = [(t, t) for t in self._get_tag_options()]
+        # Get dynamic choices (kept for the template's custom rendering in get_context_data)
+        self.restaurant_options, self.tag_options = self._get_filter_options()
+        restaurant_choices = [(r, r) for r in self.restaurant_options]
+        tag_choices = [(t, t) for t in self.tag_options]
 
         # Get GET data - use None if empty to create unbound form
         get_data = self.request.GET if self.request.GET else None
@@ -253,7 +254,7 @@ class ReviewListView(LoginRequiredMixin, ListView):
 
         # Text search filter
         if cleaned_data.get('search'):
-            search_query = SearchQuery(cleaned_data['search'])
+            search_query = SearchQuery(cleaned_data['search'], search_type='websearch')
             queryset = queryset.annotate(
                 rank=SearchRank(F('search_vector'), search_query)
             ).filter(
@@ -294,28 +295,37 @@ class ReviewListView(LoginRequiredMixin, ListView):
         order_by_fields = self._get_sort_order(cleaned_data.get('sort'), has_search=has_search)
         return queryset.order_by(*order_by_fields)
 
-    def _get_restaurant_options(self):
+    def _get_filter_options(self):
         """
-        Get restaurant names for dropdown from the Restaurant model.
-        """
-        return list(
-            Restaurant.objects.filter(reviews__is_private=False)
-            .values_list('name', flat=True)
-            .distinct()
-            .order_by('name')
-        )
+        Get restaurant names for the dropdown and distinct tags for checkboxes.
+        Both come from public reviews and are loaded with one UNION query.
 
-    def _get_tag_options(self):
-        """
-        Get distinct tags for checkboxes.
-        Returns sorted list of unique tags from public reviews.
+        Returns:
+            tuple: (sorted restaurant names, sorted unique non-empty tags)
         """
+        restaurants = Restaurant.objects.filter(
+            reviews__is_private=False
+        ).annotate(
+            kind=Value('restaurant', output_field=CharField())
+        ).values('kind', 'name')
+
         tags = ReviewTag.objects.filter(
             review__is_private=False
-        ).values_list('tag', flat=True).distinct().order_by('tag')
-
-        # Filter out None and empty strings
-        return [t for t in tags if t]
+        ).annotate(
+            kind=Value('tag', output_field=CharField())
+        ).values('kind', 'tag')
+
+        # UNION (not ALL) removes the duplicates DISTINCT used to
+        restaurant_options = []
+        tag_options = []
+        for row in restaurants.union(tags).order_by('kind', 'name'):
+            if row['kind'] == 'restaurant':
+                restaurant_options.append(row['name'])
+            elif row['name']:
+                # Filter out None and empty strings
+                tag_options.append(row['name'])
+
+        return restaurant_options, tag_options
 
     def get_context_data(self, **kwargs):
         """
@@ -332,9 +342,9 @@ class ReviewListView(LoginRequiredMixin, ListView):
         # Add filter query string for pagination links
         context['filter_query_string'] = self._build_filter_query_string(self.filter_form, exclude_page=True)
 
-        # Add dropdown options (still needed for custom rendering)
-        context['restaurant_options'] = self._get_restaurant_options()
-        context['tag_options'] = self._get_tag_options()
+        # Add dropdown options (still needed for custom rendering), as loaded for the form
+        context['restaurant_options'] = self.restaurant_options
+        context['tag_options'] = self.tag_options
 
         # Add active filters for badge display
         context['active_filters'] = self._get_active_filters()